@@ -11,11 +11,6 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from .pattern_detector import PatternDetector, PatternAlert, PatternType
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -12,11 +12,6 @@ import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class PatternType(Enum):
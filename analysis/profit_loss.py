@@ -15,11 +15,6 @@ from collections import defaultdict
 import asyncio
 from notifications.telegram_notifications import TelegramNotifier
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -59,18 +59,45 @@ MIN_MARKET_CAP = 100000  # Minimum market cap in USD
 PRICE_CHANGE_THRESHOLD = 5  # Minimum price change percentage to trigger alert
 VOLUME_SPIKE_THRESHOLD = 2  # Volume increase factor to consider as spike
 
-async def send_telegram_notification(message: str, is_error: bool = False):
+async def setup_telegram_bot(telegram_bot: TelegramBot, telegram_config: dict):
     """
-    Send a notification to Telegram chat with retry logic.
+    Start a Telegram bot in the update mode selected by the configuration.
+
+    Updates arrive through a webhook when use_webhook is set and by long
+    polling otherwise.
     """
-    try:
-        # Initialize Telegram bot
-        telegram_bot = TelegramBot(
+    if telegram_config.get("use_webhook"):
+        await telegram_bot.setup(
+            webhook_url=telegram_config["webhook_url"],
+            port=telegram_config["webhook_port"]
+        )
+    else:
+        await telegram_bot.setup()
+
+# Bot used for notifications; run_bot replaces it with the bot it starts
+_notification_bot = None
+
+def get_notification_bot() -> TelegramBot:
+    """
+    Return the long-lived bot notifications are sent with.
+
+    Sending only needs the Bot API, so the bot is never set up here and no
+    updater is started per message.
+    """
+    global _notification_bot
+    if _notification_bot is None:
+        _notification_bot = TelegramBot(
             token=TELEGRAM_BOT_TOKEN,
             chat_id=TELEGRAM_CHAT_ID
         )
-        
-        await telegram_bot.setup()
+    return _notification_bot
+
+async def send_telegram_notification(message: str, is_error: bool = False):
+    """
+    Send a notification to Telegram chat with retry logic.
+    """
+    try:
+        telegram_bot = get_notification_bot()
         
         if is_error:
             message = f"⚠️ ERROR: {message}"
@@ -310,11 +337,18 @@ def fetch_solana_token_data():
         print(f"Error in fetch_solana_token_data: {str(e)}")
         return None
 
-async def run_bot():
+async def run_bot(telegram_bot: TelegramBot = None, telegram_config: dict = None):
     """
     Main bot loop that continuously monitors and analyzes Solana tokens.
+
+    If a Telegram bot is given, it is started first so it can answer commands,
+    and notifications are sent through it.
     """
+    global _notification_bot
     print("Starting Solana trading bot...")
+    if telegram_bot is not None:
+        await setup_telegram_bot(telegram_bot, telegram_config)
+        _notification_bot = telegram_bot
     await send_telegram_notification("🚀 Solana trading bot started!\n\nMonitoring for:\n" + 
                              f"- Price changes > {PRICE_CHANGE_THRESHOLD}%\n" +
                              f"- Volume spikes > {VOLUME_SPIKE_THRESHOLD}x\n" +
@@ -371,6 +405,7 @@ def main():
     try:
         # Set up logging first
         from config.logging_config import setup_logging
+        from config.settings import load_config, validate_config
         setup_logging()
         
         # Load configuration
@@ -387,7 +422,14 @@ def main():
         
         # Continue with rest of initialization...
         setup_database(DATABASE_NAME)
-        asyncio.run(run_bot())
+
+        # Prefer the libuv event loop where it is available
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        asyncio.run(run_bot(telegram_bot, config['telegram']))
         
     except Exception as e:
         print(f"Error in main: {str(e)}")
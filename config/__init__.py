@@ -2,6 +2,6 @@
 Configuration package.
 """
 
-from .settings import load_config, validate_config
+from .settings import load_config, validate_config, validate_config_cached
 
-__all__ = ['load_config', 'validate_config']
+__all__ = ['load_config', 'validate_config', 'validate_config_cached']
@@ -34,6 +34,16 @@ class SecureConfig:
             'POSTGRES_DB': 'deepseekerbot',
             'POSTGRES_PASSWORD': ''  # Must be set in environment
         }
+
+        # Connection pool defaults; pool_recycle stays below PgBouncer's
+        # default server_idle_timeout (600s)
+        self._pool_defaults = {
+            'DB_POOL_SIZE': '10',
+            'DB_MAX_OVERFLOW': '5',
+            'DB_POOL_TIMEOUT': '30',
+            'DB_POOL_RECYCLE': '60',
+            'USE_PGBOUNCER': 'false'
+        }
         
         # Load database configuration
         for key, default in self._db_defaults.items():
@@ -94,5 +104,22 @@ class SecureConfig:
             for key, default in self._db_defaults.items()
         }
 
+    def get_pool_config(self) -> Dict[str, Any]:
+        """
+        Get connection pool configuration.
+
+        Returns:
+            Pool settings with numeric values converted and USE_PGBOUNCER
+            as a bool
+        """
+        config = {
+            key: self.get(key, default)
+            for key, default in self._pool_defaults.items()
+        }
+        config['USE_PGBOUNCER'] = str(config['USE_PGBOUNCER']).lower() in ('1', 'true', 'yes')
+        for key in ('DB_POOL_SIZE', 'DB_MAX_OVERFLOW', 'DB_POOL_TIMEOUT', 'DB_POOL_RECYCLE'):
+            config[key] = int(config[key])
+        return config
+
 # Global instance
 secure_config = SecureConfig()
@@ -3,13 +3,43 @@ Configuration settings module.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Pattern, Set, Tuple
 import logging
+from cachetools import LRUCache
 from .secure_config import secure_config
 
 logger = logging.getLogger(__name__)
 
+# Static paths rooted at the project directory, resolved once at import
+_BASE_DIR = Path(__file__).parent.parent.resolve()
+_HUMMINGBOT_PATH = str(_BASE_DIR / "hummingbot_files")
+_DB_PATH = str(_BASE_DIR / "data" / "deepseeker.db")
+_DB_BACKUP_PATH = str(_BASE_DIR / "data" / "backups")
+_LOG_FILE_PATH = str(_BASE_DIR / "logs" / "deepseeker.log")
+
+# Directories already created by validate_config during this process
+_CREATED_DIRS: Set[str] = set()
+
+# Frozen configs whose values already passed _check_structure
+_VALID_CONFIGS: LRUCache = LRUCache(maxsize=16)
+
+def compile_excluded_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+    """
+    Compile token name exclusion patterns into a single regex.
+
+    Args:
+        patterns: Substrings that exclude a token name (case-insensitive)
+
+    Returns:
+        Optional[Pattern]: Compiled alternation, or None if there are no patterns
+    """
+    patterns = [p for p in patterns if p]
+    if not patterns:
+        return None
+    return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+
 def load_config() -> Dict[str, Any]:
     """
     Load configuration settings.
@@ -17,16 +47,17 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Dict: Configuration dictionary
     """
-    # Base directory
-    base_dir = Path(__file__).parent.parent.absolute()
-
     config = {
         # Telegram Configuration
         "telegram": {
             "bot_token": secure_config.get_secret("TELEGRAM_BOT_TOKEN"),
             "chat_id": secure_config.get_secret("TELEGRAM_CHAT_ID"),
             "alert_interval": 300,  # 5 minutes
-            "performance_report_interval": 86400  # 24 hours
+            "performance_report_interval": 86400,  # 24 hours
+            # Receive updates through a webhook instead of long polling
+            "use_webhook": str(secure_config.get("TELEGRAM_USE_WEBHOOK", "false")).lower() == "true",
+            "webhook_url": secure_config.get("TELEGRAM_WEBHOOK_URL"),
+            "webhook_port": int(secure_config.get("TELEGRAM_WEBHOOK_PORT", 8443))
         },
 
         # Trading Configuration
@@ -56,7 +87,7 @@ def load_config() -> Dict[str, Any]:
 
         # Hummingbot Configuration
         "hummingbot": {
-            "instance_path": os.path.join(base_dir, "hummingbot_files"),
+            "instance_path": _HUMMINGBOT_PATH,
             "default_exchange": "binance",
             "default_market": "BTC-USDT",
             "log_level": "INFO",
@@ -97,40 +128,38 @@ def load_config() -> Dict[str, Any]:
 
         # Database Settings
         "database": {
-            "path": os.path.join(base_dir, "data", "deepseeker.db"),
-            "backup_path": os.path.join(base_dir, "data", "backups"),
+            "path": _DB_PATH,
+            "backup_path": _DB_BACKUP_PATH,
             "backup_interval": 86400
         },
 
         # Logging Settings
         "logging": {
             "level": "INFO",
-            "file_path": os.path.join(base_dir, "logs", "deepseeker.log"),
+            "file_path": _LOG_FILE_PATH,
             "max_size": 10485760,
             "backup_count": 5,
             "telegram_alerts": True
         }
     }
 
+    # Match all exclusion patterns in a single pass over the token name
+    config["filters"]["excluded_regex"] = compile_excluded_patterns(
+        config["filters"]["excluded_patterns"]
+    )
+
     return config
 
-def validate_config(config: Dict[str, Any]) -> bool:
+def _check_structure(config: Dict[str, Any]) -> bool:
     """
-    Validate configuration settings.
+    Check the configuration values themselves, without touching secrets or disk.
 
     Args:
         config: Configuration dictionary
 
     Returns:
-        bool: True if configuration is valid
-
-    Raises:
-        ValueError: If configuration is invalid
+        bool: True if the values are valid
     """
-    # Use secure config validation
-    if not secure_config.validate_secrets():
-        return False
-
     # Check trading configuration
     if config["trading"]["min_order_size"] <= 0:
         logger.error("Invalid min_order_size: must be greater than 0")
@@ -147,7 +176,15 @@ def validate_config(config: Dict[str, Any]) -> bool:
         logger.error("Invalid rugpull detection time window")
         return False
 
-    # Create necessary directories
+    return True
+
+def _create_directories(config: Dict[str, Any]) -> None:
+    """
+    Create the directories the configuration points at.
+
+    Args:
+        config: Configuration dictionary
+    """
     directories = [
         os.path.dirname(config["database"]["path"]),
         config["database"]["backup_path"],
@@ -156,6 +193,77 @@ def validate_config(config: Dict[str, Any]) -> bool:
     ]
 
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        if directory in _CREATED_DIRS:
+            continue
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
+def validate_config(config: Dict[str, Any]) -> bool:
+    """
+    Validate configuration settings.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        bool: True if configuration is valid
+
+    Raises:
+        ValueError: If configuration is invalid
+    """
+    # Use secure config validation
+    if not secure_config.validate_secrets():
+        return False
+
+    if not _check_structure(config):
+        return False
+
+    _create_directories(config)
+    return True
+
+def _freeze(config: Dict[str, Any], prefix: str = "") -> FrozenSet[Tuple[str, str]]:
+    """
+    Flatten a configuration into a hashable set of (dotted key, value) pairs.
+
+    Args:
+        config: Configuration dictionary
+        prefix: Dotted key of the enclosing section
+
+    Returns:
+        FrozenSet[Tuple[str, str]]: Leaf values keyed by their dotted path
+    """
+    items = set()
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            items |= _freeze(value, f"{path}.")
+        else:
+            items.add((path, str(value)))
+    return frozenset(items)
+
+def validate_config_cached(config: Dict[str, Any]) -> bool:
+    """
+    Validate configuration settings, reusing the value checks of configs already found valid.
+
+    Only the checks on the config values are cached; the secrets check and
+    directory creation depend on the environment and run on every call. Only
+    successful checks are remembered, so an invalid config is checked (and
+    its errors logged) every time.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        bool: True if configuration is valid
+    """
+    if not secure_config.validate_secrets():
+        return False
+
+    key = _freeze(config)
+    if key not in _VALID_CONFIGS:
+        if not _check_structure(config):
+            return False
+        _VALID_CONFIGS[key] = True
 
+    _create_directories(config)
     return True
@@ -3,6 +3,7 @@ Manager for user-defined token and contract blacklists.
 """
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 from datetime import datetime
@@ -11,6 +12,10 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Payloads below this size are written in a single thread-pool hop instead of
+# being streamed through aiofiles.
+SMALL_WRITE_LIMIT = 64 * 1024
+
 class BlacklistManager:
     """Manager for token and contract blacklists."""
 
@@ -28,6 +33,8 @@ class BlacklistManager:
         self.contracts: Set[str] = set()
         self.developers: Set[str] = set()
         self.reasons: Dict[str, str] = {}
+        # Every blacklisted item mapped to its reason ("" if none given)
+        self._index: Dict[str, str] = {}
         self._lock = asyncio.Lock()
         
         # Create file if it doesn't exist
@@ -55,23 +62,45 @@ class BlacklistManager:
                 self.contracts = set(data.get("contracts", []))
                 self.developers = set(data.get("developers", []))
                 self.reasons = data.get("reasons", {})
+            self._rebuild_index()
         except Exception as e:
-            logger.error(f"Error loading blacklist: {str(e)}")
+            logger.error("Error loading blacklist: %s", e)
             raise
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the combined lookup index after loading the blacklist."""
+        self._index = dict.fromkeys(self.tokens | self.contracts | self.developers, "")
+        for item in self._index.keys() & self.reasons.keys():
+            self._index[item] = self.reasons[item]
+
     async def save_blacklist(self) -> None:
         """Asynchronously save blacklist to file."""
         async with self._lock:
-            data = {
-                "tokens": list(self.tokens),
-                "contracts": list(self.contracts),
-                "developers": list(self.developers),
-                "reasons": self.reasons,
-                "last_updated": datetime.now().isoformat()
-            }
-            
-            async with aiofiles.open(self.blacklist_file, 'w') as f:
-                await f.write(json.dumps(data, indent=2))
+            await self._write_blacklist()
+
+    async def _write_blacklist(self) -> None:
+        """
+        Write blacklist to file atomically.
+
+        Callers must hold ``self._lock``.
+        """
+        data = {
+            "tokens": list(self.tokens),
+            "contracts": list(self.contracts),
+            "developers": list(self.developers),
+            "reasons": self.reasons,
+            "last_updated": datetime.now().isoformat()
+        }
+        payload = json.dumps(data, indent=2).encode()
+        tmp_file = self.blacklist_file.with_name(self.blacklist_file.name + ".tmp")
+
+        if len(payload) < SMALL_WRITE_LIMIT:
+            await asyncio.to_thread(tmp_file.write_bytes, payload)
+        else:
+            async with aiofiles.open(tmp_file, 'wb') as f:
+                await f.write(payload)
+
+        os.replace(tmp_file, self.blacklist_file)
 
     async def add_to_blacklist(
         self, 
@@ -100,7 +129,8 @@ class BlacklistManager:
             if reason:
                 self.reasons[item] = reason
             
-            await self.save_blacklist()
+            self._index[item] = self.reasons.get(item, "")
+            await self._write_blacklist()
 
     async def remove_from_blacklist(self, item: str, category: str) -> None:
         """
@@ -123,7 +153,12 @@ class BlacklistManager:
             if item in self.reasons:
                 del self.reasons[item]
             
-            await self.save_blacklist()
+            # The item stays listed, without a reason, under any other category
+            if item in self.tokens or item in self.contracts or item in self.developers:
+                self._index[item] = ""
+            else:
+                self._index.pop(item, None)
+            await self._write_blacklist()
 
     def is_blacklisted(self, item: str) -> bool:
         """
@@ -135,11 +170,7 @@ class BlacklistManager:
         Returns:
             bool: True if blacklisted
         """
-        return (
-            item in self.tokens or 
-            item in self.contracts or 
-            item in self.developers
-        )
+        return item in self._index
 
     def get_blacklist_reason(self, item: str) -> Optional[str]:
         """
@@ -152,3 +183,16 @@ class BlacklistManager:
             Optional[str]: Reason for blacklisting, if any
         """
         return self.reasons.get(item)
+
+    def check(self, item: str) -> Optional[str]:
+        """
+        Check an item against the blacklist with a single lookup.
+
+        Args:
+            item: Token address, contract, or developer to check
+
+        Returns:
+            Optional[str]: None if not blacklisted, otherwise the reason
+            ("" if none was given)
+        """
+        return self._index.get(item)
@@ -2,6 +2,26 @@
 Data processing utilities for handling and normalizing token data.
 """
 
+from typing import Dict
+
+def compact(data: Dict) -> Dict:
+    """
+    Keep only the scalar values of an API response section.
+
+    Nested lists and objects (e.g. full holder lists) are dropped so that
+    cached results do not keep large upstream payloads alive.
+
+    Args:
+        data: API response section
+
+    Returns:
+        Dict: Copy of data without nested containers
+    """
+    return {
+        key: value for key, value in data.items()
+        if not isinstance(value, (dict, list))
+    }
+
 class DataProcessor:
     def __init__(self):
         self.data_cache = {}
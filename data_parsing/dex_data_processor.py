@@ -6,13 +6,17 @@ preparing it for further analysis and storage.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
+import numpy as np
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Liquidity thresholds in USD ($100K, $1M) and the score/risk for each band
+_LIQ_THRESHOLDS = np.array([1e5, 1e6])
+_LIQ_SCORE = np.array([0.3, 0.7, 1.0])
+_LIQ_RISK = np.array(['HIGH', 'MEDIUM', 'LOW'])
+
 class DexDataProcessor:
     """Processor for DexScreener API data."""
     
@@ -57,7 +61,7 @@ class DexDataProcessor:
             
             return processed
         except Exception as e:
-            logger.error(f"Error processing token data: {str(e)}")
+            logger.error("Error processing token data: %s", e)
             return {}
     
     def analyze_liquidity(self, token_data: Dict) -> Tuple[float, str]:
@@ -72,21 +76,29 @@ class DexDataProcessor:
         """
         try:
             liquidity = token_data.get('liquidity_usd', 0)
-            
-            # Define liquidity thresholds
-            HIGH_LIQUIDITY = 1000000  # $1M
-            MEDIUM_LIQUIDITY = 100000  # $100K
-            
-            if liquidity >= HIGH_LIQUIDITY:
-                return (1.0, 'LOW')
-            elif liquidity >= MEDIUM_LIQUIDITY:
-                return (0.7, 'MEDIUM')
-            else:
-                return (0.3, 'HIGH')
+            idx = np.searchsorted(_LIQ_THRESHOLDS, liquidity, side='right')
+            return (float(_LIQ_SCORE[idx]), str(_LIQ_RISK[idx]))
         except Exception as e:
-            logger.error(f"Error analyzing liquidity: {str(e)}")
+            logger.error("Error analyzing liquidity: %s", e)
             return (0.0, 'UNKNOWN')
     
+    def analyze_liquidity_batch(
+        self, liquidities: Sequence[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Analyze liquidity for many tokens at once.
+
+        Args:
+            liquidities (Sequence[float]): Liquidity values in USD
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Liquidity scores and risk levels
+        """
+        idx = np.searchsorted(
+            _LIQ_THRESHOLDS, np.asarray(liquidities, dtype=float), side='right'
+        )
+        return _LIQ_SCORE[idx], _LIQ_RISK[idx]
+    
     def analyze_price_movement(self, token_data: Dict) -> Dict:
         """
         Analyze price movements and volatility.
@@ -116,7 +128,7 @@ class DexDataProcessor:
                 'timestamp': datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Error analyzing price movement: {str(e)}")
+            logger.error("Error analyzing price movement: %s", e)
             return {}
     
     def get_stored_data(self, token_address: str) -> Optional[Dict]:
@@ -162,5 +174,5 @@ class DexDataProcessor:
                 }
             }
         except Exception as e:
-            logger.error(f"Error calculating metrics: {str(e)}")
+            logger.error("Error calculating metrics: %s", e)
             return {}
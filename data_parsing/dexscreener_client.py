@@ -7,12 +7,11 @@ token information, price charts, and transaction history.
 
 import aiohttp
 import logging
-from datetime import datetime, timedelta
+import time
 from typing import Dict, List, Optional, Union
 import json
+from .http_pool import http_pool
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class DexScreenerClient:
@@ -20,27 +19,30 @@ class DexScreenerClient:
     
     BASE_URL = "https://api.dexscreener.com/latest"
     
-    def __init__(self, cache_duration: int = 300):
+    def __init__(
+        self,
+        cache_duration: int = 300,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize the DexScreener API client.
-        
+
         Args:
             cache_duration (int): Duration in seconds to cache API responses. Defaults to 5 minutes.
+            session (Optional[aiohttp.ClientSession]): Optional shared session. Defaults to the shared HTTP pool.
         """
-        self.session = None
+        self.session = session
         self.cache = {}
         self.cache_duration = cache_duration
         self.cache_timestamps = {}
 
     async def __aenter__(self):
-        """Create aiohttp session when entering context."""
-        self.session = aiohttp.ClientSession()
+        """Enter context; requests go through the shared HTTP pool."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close aiohttp session when exiting context."""
-        if self.session:
-            await self.session.close()
+        """Exit context; the shared HTTP pool stays open."""
+        return None
 
     def _is_cache_valid(self, cache_key: str) -> bool:
         """
@@ -52,11 +54,8 @@ class DexScreenerClient:
         Returns:
             bool: True if cache is valid, False otherwise
         """
-        if cache_key not in self.cache_timestamps:
-            return False
-        
-        cache_time = self.cache_timestamps[cache_key]
-        return (datetime.now() - cache_time).seconds < self.cache_duration
+        cached_at = self.cache_timestamps.get(cache_key)
+        return cached_at is not None and time.monotonic() - cached_at < self.cache_duration
 
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
@@ -73,9 +72,6 @@ class DexScreenerClient:
             aiohttp.ClientError: If the request fails
             json.JSONDecodeError: If the response cannot be parsed as JSON
         """
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-
         url = f"{self.BASE_URL}/{endpoint}"
         cache_key = f"{url}:{json.dumps(params or {})}"
 
@@ -84,20 +80,18 @@ class DexScreenerClient:
             return self.cache[cache_key]
 
         try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-                
-                # Cache the response
-                self.cache[cache_key] = data
-                self.cache_timestamps[cache_key] = datetime.now()
-                
-                return data
+            data = await http_pool.get(url, params=params, session=self.session)
+
+            # Cache the response
+            self.cache[cache_key] = data
+            self.cache_timestamps[cache_key] = time.monotonic()
+
+            return data
         except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {str(e)}")
+            logger.error("API request failed: %s", e)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse API response: {str(e)}")
+            logger.error("Failed to parse API response: %s", e)
             raise
 
     async def get_token(self, token_address: str) -> Dict:
@@ -113,11 +107,11 @@ class DexScreenerClient:
         try:
             response = await self._make_request(f"tokens/{token_address}")
             if not response.get('pairs'):
-                logger.warning(f"No pairs found for token {token_address}")
+                logger.warning("No pairs found for token %s", token_address)
                 return {}
             return response
         except Exception as e:
-            logger.error(f"Failed to get token data: {str(e)}")
+            logger.error("Failed to get token data: %s", e)
             return {}
 
     async def get_pair(self, pair_address: str) -> Dict:
@@ -133,11 +127,11 @@ class DexScreenerClient:
         try:
             response = await self._make_request(f"pairs/{pair_address}")
             if not response.get('pair'):
-                logger.warning(f"No data found for pair {pair_address}")
+                logger.warning("No data found for pair %s", pair_address)
                 return {}
             return response
         except Exception as e:
-            logger.error(f"Failed to get pair data: {str(e)}")
+            logger.error("Failed to get pair data: %s", e)
             return {}
 
     async def search_pairs(self, query: str) -> List[Dict]:
@@ -154,13 +148,13 @@ class DexScreenerClient:
             response = await self._make_request("search", {"q": query})
             return response.get('pairs', [])
         except Exception as e:
-            logger.error(f"Failed to search pairs: {str(e)}")
+            logger.error("Failed to search pairs: %s", e)
             return []
 
     def clear_cache(self) -> None:
-        """Clear the API response cache."""
-        self.cache.clear()
-        self.cache_timestamps.clear()
+        """Clear the API response cache by swapping in empty dicts."""
+        self.cache = {}
+        self.cache_timestamps = {}
 
     async def get_recent_transactions(self, pair_address: str, limit: int = 100) -> List[Dict]:
         """
@@ -182,7 +176,7 @@ class DexScreenerClient:
             # This is a placeholder for when/if they add this endpoint
             return []
         except Exception as e:
-            logger.error(f"Failed to get recent transactions: {str(e)}")
+            logger.error("Failed to get recent transactions: %s", e)
             return []
 
     async def get_price_history(self, pair_address: str) -> Dict:
@@ -208,5 +202,5 @@ class DexScreenerClient:
                 'price_change_24h': pair_data.get('pair', {}).get('priceChange24h')
             }
         except Exception as e:
-            logger.error(f"Failed to get price history: {str(e)}")
+            logger.error("Failed to get price history: %s", e)
             return {}
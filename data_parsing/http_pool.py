@@ -0,0 +1,305 @@
+"""
+Shared HTTP connection pool for the API clients.
+
+This module provides a single aiohttp session, a global concurrency limit and
+per-host rate limits that are shared by every API client, so concurrent scans
+reuse connections and stay within upstream rate limits.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Total time allowed for one upstream request, in seconds
+REQUEST_TIMEOUT = 10.0
+
+# Upstream rate limits as (max calls, period in seconds)
+DEFAULT_RATE_LIMITS = {
+    "api.dexscreener.com": (300, 60.0),
+}
+
+# Number of callers awaiting each coalesced task
+_waiters: Dict[asyncio.Future, int] = {}
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a connector tuned for the API clients.
+
+    aiohttp advertises and decodes gzip/deflate, plus brotli when the Brotli
+    package is installed, so responses arrive compressed.
+
+    Returns:
+        aiohttp.ClientSession: New session; the caller is responsible for closing it
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    )
+
+async def coalesce(
+    inflight: Dict[Hashable, "asyncio.Task[T]"],
+    key: Hashable,
+    factory: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+
+    The first caller starts factory() as a task; later callers await the same
+    task until it completes. The task is shielded so that one caller being
+    cancelled does not cancel the work for the others; once every caller has
+    been cancelled, the task itself is cancelled.
+
+    Args:
+        inflight: Map of key to running task, owned by the caller
+        key: Deduplication key, e.g. a token address
+        factory: Zero-argument coroutine function doing the actual work
+
+    Returns:
+        T: Result of the shared call
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        _waiters[task] = 0
+
+        def _done(done: asyncio.Future) -> None:
+            inflight.pop(key, None)
+            _waiters.pop(done, None)
+
+        task.add_done_callback(_done)
+
+    _waiters[task] += 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        # Leaving before the task is done means this caller was cancelled
+        if not task.done():
+            _waiters[task] -= 1
+            if not _waiters[task]:
+                task.cancel()
+
+class RateLimiter:
+    """
+    Per-host limiter combining a sliding-window call cap with AIMD concurrency.
+
+    Calls are capped at max_calls per period using a deque of recent call
+    timestamps. The number of concurrent requests is adjusted additively
+    (+alpha) on healthy responses and multiplicatively (*beta) on 429/5xx.
+    Retry-After and X-RateLimit-Remaining headers pause the host when the
+    upstream signals that its quota is exhausted.
+    """
+
+    def __init__(
+        self,
+        max_calls: Optional[int],
+        period: float = 60.0,
+        max_concurrency: int = 20,
+        alpha: float = 0.5,
+        beta: float = 0.5
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_calls: Maximum number of calls per period, or None for no cap
+            period: Period length in seconds
+            max_concurrency: Upper bound for concurrent requests
+            alpha: Additive concurrency increase per healthy response
+            beta: Multiplicative concurrency decrease on 429/5xx
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self.max_concurrency = max_concurrency
+        self.alpha = alpha
+        self.beta = beta
+        self.concurrency = float(max_concurrency)
+        self._calls: Deque[float] = deque()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Condition()
+
+    async def wait(self) -> None:
+        """Wait until the sliding window and any upstream pause allow a call."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                delay = self._paused_until - now
+                if self.max_calls is not None:
+                    while self._calls and now - self._calls[0] >= self.period:
+                        self._calls.popleft()
+                    if len(self._calls) >= self.max_calls:
+                        delay = max(delay, self._calls[0] + self.period - now)
+                if delay <= 0:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(delay)
+
+    async def __aenter__(self):
+        await self.wait()
+        async with self._slots:
+            await self._slots.wait_for(
+                lambda: self._in_flight < max(1, int(self.concurrency))
+            )
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Adjust concurrency and pauses from an upstream response.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers
+        """
+        if status == 429 or status >= 500:
+            self.concurrency = max(1.0, self.concurrency * self.beta)
+        else:
+            self.concurrency = min(
+                float(self.max_concurrency), self.concurrency + self.alpha
+            )
+
+        retry_after = _parse_float(headers.get("retry-after"))
+        remaining = _parse_float(headers.get("x-ratelimit-remaining"))
+        quota_low = (
+            remaining is not None
+            and self.max_calls is not None
+            and remaining < self.max_calls * 0.1
+        )
+        if retry_after is not None and (status == 429 or quota_low):
+            logger.warning(
+                "Rate limited by upstream, pausing for %.1fs", retry_after
+            )
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + retry_after
+            )
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, returning None if absent or invalid."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+class HttpPool:
+    """Single aiohttp session shared by all API clients."""
+
+    def __init__(self, max_concurrency: int = 10):
+        """
+        Initialize the pool.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_limits: Dict[str, Tuple[int, float]] = dict(DEFAULT_RATE_LIMITS)
+        self.limiters: Dict[str, RateLimiter] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        """Rebuild loop-bound state when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Sessions, locks and semaphores are bound to the loop that uses them
+        self._loop = loop
+        self._session = None
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.limiters = {}
+
+    def _limiter(self, host: str) -> RateLimiter:
+        """Return the limiter for a host, creating it on first use."""
+        limiter = self.limiters.get(host)
+        if limiter is None:
+            max_calls, period = self.rate_limits.get(host, (None, 60.0))
+            limiter = self.limiters[host] = RateLimiter(max_calls, period)
+        return limiter
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+        return self._session
+
+    def set_rate_limit(self, host: str, max_calls: int, period: float) -> None:
+        """
+        Set the rate limit for a host.
+
+        Args:
+            host: Host name, e.g. "api.dexscreener.com"
+            max_calls: Maximum number of calls per period
+            period: Period length in seconds
+        """
+        self.rate_limits[host] = (max_calls, period)
+        self.limiters.pop(host, None)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Any:
+        """
+        Make a rate-limited GET request and return the decoded JSON body.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional request headers
+            session: Session to use instead of the pool's own session
+
+        Returns:
+            Any: JSON response
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+            orjson.JSONDecodeError: If the response is not valid JSON
+        """
+        self._bind_loop()
+        session = session or self.session
+        limiter = self._limiter(urlsplit(url).hostname)
+
+        async with limiter, self.semaphore:
+            async with session.get(url, params=params, headers=headers) as response:
+                limiter.update(response.status, response.headers)
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+
+    async def close(self) -> None:
+        """Close the shared session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+# Global pool instance
+http_pool = HttpPool()
@@ -0,0 +1,62 @@
+"""
+Risk factor flags shared by the safety analysis clients.
+
+Risk factors are accumulated as an IntFlag bitmask while parsing and only
+expanded into human-readable strings once per result.
+"""
+
+from enum import IntFlag
+from typing import Any, List, Mapping, Optional
+
+class Risk(IntFlag):
+    """Individual risk factors detected for a token."""
+    NONE = 0
+    # Rugcheck.xyz
+    CONTRACT_UNVERIFIED = 1 << 0
+    HONEYPOT = 1 << 1
+    OWNER_CONTRACT = 1 << 2
+    OWNER_RENOUNCED = 1 << 3
+    TOP_HOLDER = 1 << 4
+    # TokenSniffer
+    TOKENSNIFFER_HONEYPOT = 1 << 5
+    MINT = 1 << 6
+    OWNER_BALANCE = 1 << 7
+    # Honeypot.is
+    HONEYPOT_IS_HONEYPOT = 1 << 8
+    HIGH_BUY_TAX = 1 << 9
+    HIGH_SELL_TAX = 1 << 10
+
+# Description for each flag, in reporting order; "{}" takes the flag's value
+_DESCRIPTIONS = (
+    (Risk.CONTRACT_UNVERIFIED, "Contract not verified"),
+    (Risk.HONEYPOT, "Potential honeypot detected"),
+    (Risk.OWNER_CONTRACT, "Owner is a contract"),
+    (Risk.OWNER_RENOUNCED, "Ownership renounced"),
+    (Risk.TOP_HOLDER, "Top holder owns {}% of supply"),
+    (Risk.TOKENSNIFFER_HONEYPOT, "Potential honeypot detected by TokenSniffer"),
+    (Risk.MINT, "Contract has mint function"),
+    (Risk.OWNER_BALANCE, "Owner holds {}% of supply"),
+    (Risk.HONEYPOT_IS_HONEYPOT, "Potential honeypot detected by Honeypot.is"),
+    (Risk.HIGH_BUY_TAX, "High buy tax: {}%"),
+    (Risk.HIGH_SELL_TAX, "High sell tax: {}%"),
+)
+
+def describe(mask: Risk, values: Optional[Mapping[Risk, Any]] = None) -> List[str]:
+    """
+    Expand a risk bitmask into human-readable risk factors.
+
+    Args:
+        mask: Combined risk flags
+        values: Optional values for flags whose description takes one
+
+    Returns:
+        List[str]: Risk factor descriptions in reporting order
+    """
+    if not mask:
+        return []
+    values = values or {}
+    return [
+        text.format(values[flag]) if flag in values else text
+        for flag, text in _DESCRIPTIONS
+        if mask & flag
+    ]
@@ -6,20 +6,26 @@ contract safety checks and identify suspicious tokens.
 """
 
 import logging
+import asyncio
+import time
 import aiohttp
+from cachetools import TTLCache
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from datetime import datetime
+from dataclasses import dataclass, field
 import json
+import orjson
+from types import MappingProxyType
+from .data_processor import compact
+from .http_pool import coalesce, http_pool
+from .risk import Risk, describe
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Read-only stand-in for missing nested sections of the API response
+_EMPTY = MappingProxyType({})
+
+@dataclass(slots=True, frozen=True)
 class RugcheckResult:
     """Results from Rugcheck.xyz analysis."""
     token_address: str
@@ -29,51 +35,40 @@ class RugcheckResult:
     contract_verified: bool
     holder_analysis: Dict
     timestamp: datetime
-    raw_data: Dict
+    raw_data: Dict = field(default_factory=dict)
+    risk_mask: Risk = Risk.NONE
 
 class RugcheckClient:
     """Client for interacting with Rugcheck.xyz API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize the Rugcheck.xyz API client.
 
         Args:
             api_key: Optional API key for extended functionality
+            session: Optional shared session; defaults to the shared HTTP pool
         """
         self.base_url = "https://api.rugcheck.xyz/v1"
         self.api_key = api_key
-        self.session = None
-        self.cache = {}
-        self.cache_duration = timedelta(minutes=30)
+        self._headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.session = session
+        self.cache = TTLCache(maxsize=10000, ttl=1800, timer=time.monotonic)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.bundle_cache = TTLCache(maxsize=10000, ttl=1800, timer=time.monotonic)
+        self._bundle_inflight: Dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
-        """Create aiohttp session when entering context."""
-        self.session = aiohttp.ClientSession(
-            headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
-        )
+        """Enter context; requests go through the shared HTTP pool."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close aiohttp session when exiting context."""
-        if self.session:
-            await self.session.close()
-
-    def _is_cache_valid(self, token_address: str) -> bool:
-        """
-        Check if cached data is still valid.
-
-        Args:
-            token_address: Token address to check
-
-        Returns:
-            bool: True if cache is valid, False otherwise
-        """
-        if token_address not in self.cache:
-            return False
-        
-        cache_time = self.cache[token_address].timestamp
-        return datetime.now() - cache_time < self.cache_duration
+        """Exit context; the shared HTTP pool stays open."""
+        return None
 
     async def check_token(self, token_address: str) -> RugcheckResult:
         """
@@ -85,33 +80,36 @@ class RugcheckClient:
         Returns:
             RugcheckResult: Analysis results
         """
-        if self._is_cache_valid(token_address):
-            return self.cache[token_address]
+        cached = self.cache.get(token_address)
+        if cached is not None:
+            return cached
 
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession(
-                    headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
-                )
+        # Concurrent checks of the same token share one upstream request
+        return await coalesce(
+            self._inflight, token_address, lambda: self._fetch_token(token_address)
+        )
 
-            async with self.session.get(
-                f"{self.base_url}/check/{token_address}"
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+    async def _fetch_token(self, token_address: str) -> RugcheckResult:
+        """Fetch a token check from Rugcheck.xyz and cache the result."""
+        try:
+            data = await http_pool.get(
+                f"{self.base_url}/check/{token_address}",
+                headers=self._headers,
+                session=self.session
+            )
 
-                result = self._parse_rugcheck_response(token_address, data)
-                self.cache[token_address] = result
-                return result
+            result = self._parse_rugcheck_response(token_address, data)
+            self.cache[token_address] = result
+            return result
 
         except aiohttp.ClientError as e:
-            logger.error(f"Rugcheck API request failed: {str(e)}")
+            logger.error("Rugcheck API request failed: %s", e)
             return self._create_error_result(token_address, f"API request failed: {str(e)}")
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Rugcheck API response: {str(e)}")
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
+            logger.error("Failed to parse Rugcheck API response: %s", e)
             return self._create_error_result(token_address, "Invalid API response")
         except Exception as e:
-            logger.error(f"Unexpected error in Rugcheck check: {str(e)}")
+            logger.error("Unexpected error in Rugcheck check: %s", e)
             return self._create_error_result(token_address, f"Unexpected error: {str(e)}")
 
     def _parse_rugcheck_response(self, token_address: str, data: Dict) -> RugcheckResult:
@@ -125,63 +123,61 @@ class RugcheckClient:
         Returns:
             RugcheckResult: Parsed results
         """
-        risk_factors = []
-        
+        mask = Risk.NONE
+
         # Extract contract verification status
-        contract_verified = data.get('contract', {}).get('verified', False)
+        contract_verified = (data.get('contract') or _EMPTY).get('verified', False)
         if not contract_verified:
-            risk_factors.append("Contract not verified")
+            mask |= Risk.CONTRACT_UNVERIFIED
 
         # Check for honeypot characteristics
-        if data.get('honeypot', {}).get('is_honeypot', False):
-            risk_factors.append("Potential honeypot detected")
+        if (data.get('honeypot') or _EMPTY).get('is_honeypot', False):
+            mask |= Risk.HONEYPOT
 
         # Analyze ownership
-        ownership = data.get('ownership', {})
+        ownership = data.get('ownership') or _EMPTY
         if ownership.get('owner_is_contract', False):
-            risk_factors.append("Owner is a contract")
+            mask |= Risk.OWNER_CONTRACT
         if ownership.get('renounced', False):
-            risk_factors.append("Ownership renounced")
+            mask |= Risk.OWNER_RENOUNCED
 
         # Check holder distribution
-        holders = data.get('holders', {})
+        holders = data.get('holders') or _EMPTY
         top_holder_pct = holders.get('top_holder_percentage', 0)
         if top_holder_pct > 20:
-            risk_factors.append(f"Top holder owns {top_holder_pct}% of supply")
+            mask |= Risk.TOP_HOLDER
 
         # Determine risk level
-        risk_level = self._calculate_risk_level(risk_factors, data)
+        risk_level = self._calculate_risk_level(mask)
 
         return RugcheckResult(
             token_address=token_address,
             is_safe=risk_level in ['SAFE', 'MEDIUM'],
             risk_level=risk_level,
-            risk_factors=risk_factors,
+            risk_factors=describe(mask, {Risk.TOP_HOLDER: top_holder_pct}),
             contract_verified=contract_verified,
-            holder_analysis=holders,
+            holder_analysis=compact(holders),
             timestamp=datetime.now(),
-            raw_data=data
+            risk_mask=mask
         )
 
-    def _calculate_risk_level(self, risk_factors: List[str], data: Dict) -> str:
+    def _calculate_risk_level(self, mask: Risk) -> str:
         """
         Calculate overall risk level based on factors.
 
         Args:
-            risk_factors: List of identified risk factors
-            data: Raw API response data
+            mask: Identified risk factors
 
         Returns:
             str: Risk level classification
         """
-        if data.get('honeypot', {}).get('is_honeypot', False):
+        if mask & Risk.HONEYPOT:
             return 'CRITICAL'
-        
-        if len(risk_factors) >= 3:
+
+        count = mask.bit_count()
+        if count >= 3:
             return 'HIGH'
-        elif len(risk_factors) >= 2:
-            return 'MEDIUM'
-        elif len(risk_factors) >= 1:
+        elif count >= 1:
             return 'MEDIUM'
         else:
             return 'SAFE'
@@ -204,8 +200,7 @@ class RugcheckClient:
             risk_factors=[f"Error: {error_message}"],
             contract_verified=False,
             holder_analysis={},
-            timestamp=datetime.now(),
-            raw_data={}
+            timestamp=datetime.now()
         )
 
     async def get_bundled_tokens(self, token_address: str) -> List[str]:
@@ -218,23 +213,38 @@ class RugcheckClient:
         Returns:
             List[str]: List of bundled token addresses
         """
+        cached = self.bundle_cache.get(token_address)
+        if cached is None:
+            cached = await coalesce(
+                self._bundle_inflight,
+                token_address,
+                lambda: self._fetch_bundled_tokens(token_address)
+            )
+        return list(cached)
+
+    async def _fetch_bundled_tokens(self, token_address: str) -> Tuple[str, ...]:
+        """Fetch bundled token addresses from Rugcheck.xyz and cache them."""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession(
-                    headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
-                )
-
-            async with self.session.get(
-                f"{self.base_url}/bundles/{token_address}"
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data.get('bundled_tokens', [])
-
+            data = await http_pool.get(
+                f"{self.base_url}/bundles/{token_address}",
+                headers=self._headers,
+                session=self.session
+            )
         except Exception as e:
-            logger.error(f"Error getting bundled tokens: {str(e)}")
-            return []
+            logger.error("Error getting bundled tokens: %s", e)
+            return ()
+
+        bundled = tuple(data.get('bundled_tokens', []))
+        self.bundle_cache[token_address] = bundled
+        return bundled
 
     def clear_cache(self) -> None:
-        """Clear the API response cache."""
-        self.cache.clear()
+        """Clear the API response caches by swapping in empty ones."""
+        self.cache = TTLCache(
+            maxsize=self.cache.maxsize, ttl=self.cache.ttl, timer=time.monotonic
+        )
+        self.bundle_cache = TTLCache(
+            maxsize=self.bundle_cache.maxsize,
+            ttl=self.bundle_cache.ttl,
+            timer=time.monotonic
+        )
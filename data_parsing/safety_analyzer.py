@@ -6,24 +6,102 @@ comprehensive token safety analysis.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from typing import TYPE_CHECKING, Awaitable, Dict, Iterable, List, Optional, Set, Tuple
+import time
+import aiohttp
+from cachetools import TTLCache
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from .dexscreener_client import DexScreenerClient
 from .rugcheck_client import RugcheckClient, RugcheckResult
 from .tokensniffer_client import TokenSnifferClient, TokenSnifferResult
 from .honeypot_client import HoneypotClient, HoneypotResult
 from .blacklist_manager import BlacklistManager
+from .http_pool import coalesce, create_session
+from .risk import Risk, describe
 import asyncio
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+if TYPE_CHECKING:
+    from database import TokenSafetyRepository
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Average risk score upper bounds for SAFE, MEDIUM and HIGH (CRITICAL above)
+_SAFE = 1.0
+_MEDIUM = 2.0
+_HIGH = 2.5
+# Maps a 0-100 TokenSniffer trust score onto the 0-3 risk scale
+_TRUST_DIV = 100.0 / 3.0
+
+# Recommendation headline per risk level; other levels use the SAFE one
+_REC_TEMPLATES = {
+    "CRITICAL": "DO NOT TRADE - Multiple critical risk factors detected",
+    "HIGH": "EXTREME CAUTION - High risk token with multiple warning signs",
+    "MEDIUM": "CAUTION - Trade with limited exposure",
+    "SAFE": "MODERATE RISK - Standard trading precautions apply"
+}
+# Levels whose headline is the whole recommendation
+_FINAL_LEVELS = frozenset(("CRITICAL", "HIGH"))
+_TAX_NOTE_FMT = "Note: Buy tax {}%, Sell tax {}%"
+
+# DexScreener pair fields kept in SafetyAnalysis.dex_data
+_DEX_FIELDS = (
+    'chainId', 'dexId', 'pairAddress', 'priceUsd',
+    'liquidity', 'volume', 'priceChange', 'fdv'
+)
+
+def _summarize_dex_data(dex_data: Dict) -> Dict:
+    """
+    Reduce a DexScreener token response to its most liquid pair's key fields.
+
+    Args:
+        dex_data: DexScreener token response
+
+    Returns:
+        Dict: Compact pair summary, or dex_data itself if it has no pairs
+    """
+    pairs = dex_data.get('pairs')
+    if not pairs:
+        return dex_data
+    pair = max(pairs, key=lambda p: float((p.get('liquidity') or {}).get('usd') or 0))
+    return {key: pair[key] for key in _DEX_FIELDS if key in pair}
+
+def _is_critical(result) -> bool:
+    """
+    Check whether a single provider result already makes a token CRITICAL.
+
+    Args:
+        result: Rugcheck, TokenSniffer or Honeypot.is result
+
+    Returns:
+        bool: True if no other provider can change the verdict
+    """
+    if isinstance(result, RugcheckResult):
+        return result.risk_level == 'CRITICAL'
+    return getattr(result, 'is_honeypot', False)
+
+def _result_or_none(task: asyncio.Task):
+    """Return a finished task's result, or None if it was cancelled."""
+    return None if task.cancelled() else task.result()
+
+async def _provider_check(name: str, check: Awaitable):
+    """
+    Await a provider check, turning request failures into a missing result.
+
+    Args:
+        name: Provider name for logging
+        check: Provider check coroutine
+
+    Returns:
+        Provider result, or None if the provider request failed
+    """
+    try:
+        return await check
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.warning("%s check failed: %s", name, e)
+        return None
+
+@dataclass(slots=True, frozen=True)
 class SafetyAnalysis:
     """Combined safety analysis results."""
     token_address: str
@@ -37,6 +115,7 @@ class SafetyAnalysis:
     blacklist_info: Optional[str]
     timestamp: datetime
     recommendation: str
+    risk_mask: Risk = Risk.NONE
 
 class SafetyAnalyzer:
     """Analyzer combining multiple data sources for comprehensive safety analysis."""
@@ -45,7 +124,11 @@ class SafetyAnalyzer:
         self,
         rugcheck_api_key: Optional[str] = None,
         tokensniffer_api_key: Optional[str] = None,
-        honeypot_api_key: Optional[str] = None
+        honeypot_api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        repo: Optional["TokenSafetyRepository"] = None,
+        repo_max_age: timedelta = timedelta(minutes=30),
+        blacklist_manager: Optional[BlacklistManager] = None
     ):
         """
         Initialize the safety analyzer.
@@ -54,28 +137,51 @@ class SafetyAnalyzer:
             rugcheck_api_key: Optional API key for Rugcheck.xyz
             tokensniffer_api_key: Optional API key for TokenSniffer
             honeypot_api_key: Optional API key for Honeypot.is
+            session: Optional session shared by all API clients
+            repo: Optional repository persisting analyses across restarts
+            repo_max_age: Maximum age of a stored analysis that is reused
+            blacklist_manager: Optional blacklist; defaults to config/blacklist.json
         """
-        self.dex_client = DexScreenerClient()
-        self.rugcheck_client = RugcheckClient(rugcheck_api_key)
-        self.tokensniffer_client = TokenSnifferClient(tokensniffer_api_key)
-        self.honeypot_client = HoneypotClient(honeypot_api_key)
-        self.blacklist_manager = BlacklistManager()
-        self.analysis_cache = {}
+        self.session = session
+        self.repo = repo
+        self.repo_max_age = repo_max_age
+        self._pending_writes: Set[asyncio.Task] = set()
+        self._owns_session = False
+        self.dex_client = DexScreenerClient(session=session)
+        self.rugcheck_client = RugcheckClient(rugcheck_api_key, session=session)
+        self.tokensniffer_client = TokenSnifferClient(tokensniffer_api_key, session=session)
+        self.honeypot_client = HoneypotClient(honeypot_api_key, session=session)
+        self.blacklist_manager = blacklist_manager or BlacklistManager()
+        self.analysis_cache = TTLCache(maxsize=10000, ttl=1800, timer=time.monotonic)
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
-        """Set up API clients."""
-        self.dex_client = await self.dex_client.__aenter__()
-        self.rugcheck_client = await self.rugcheck_client.__aenter__()
-        self.tokensniffer_client = await self.tokensniffer_client.__aenter__()
-        self.honeypot_client = await self.honeypot_client.__aenter__()
+        """Create one session and share it across all API clients."""
+        if self.session is None:
+            self.session = create_session()
+            self._owns_session = True
+            self._set_client_sessions(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up API clients."""
-        await self.dex_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.rugcheck_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.tokensniffer_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.honeypot_client.__aexit__(exc_type, exc_val, exc_tb)
+        """Flush pending writes and close the shared session if it was created here."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        if self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+            self._set_client_sessions(None)
+
+    def _set_client_sessions(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """Point every API client at the given session."""
+        for client in (
+            self.dex_client,
+            self.rugcheck_client,
+            self.tokensniffer_client,
+            self.honeypot_client
+        ):
+            client.session = session
 
     async def analyze_token(self, token_address: str) -> SafetyAnalysis:
         """
@@ -88,8 +194,8 @@ class SafetyAnalyzer:
             SafetyAnalysis: Combined analysis results
         """
         # Check blacklist first
-        if self.blacklist_manager.is_blacklisted(token_address):
-            reason = self.blacklist_manager.get_blacklist_reason(token_address)
+        reason = self.blacklist_manager.check(token_address)
+        if reason is not None:
             return SafetyAnalysis(
                 token_address=token_address,
                 is_safe=False,
@@ -99,25 +205,70 @@ class SafetyAnalyzer:
                 rugcheck_data=None,
                 tokensniffer_data=None,
                 honeypot_data=None,
-                blacklist_info=reason,
+                blacklist_info=reason or None,
                 timestamp=datetime.now(),
                 recommendation="DO NOT TRADE - Token is blacklisted"
             )
 
+        cached = self.analysis_cache.get(token_address)
+        if cached is not None:
+            return cached
+
+        # Concurrent analyses of the same token share one run
+        return await coalesce(
+            self._inflight, token_address, lambda: self._analyze(token_address)
+        )
+
+    async def analyze_tokens(self, token_addresses: Iterable[str]) -> Dict[str, SafetyAnalysis]:
+        """
+        Analyze a batch of tokens concurrently.
+
+        Duplicate addresses are analyzed once. Tokens whose analysis fails are
+        logged and left out of the result.
+
+        Args:
+            token_addresses: Token addresses to analyze
+
+        Returns:
+            Dict[str, SafetyAnalysis]: Analysis per token address
+        """
+        addresses = list(dict.fromkeys(token_addresses))
+        results = await asyncio.gather(
+            *(self.analyze_token(address) for address in addresses),
+            return_exceptions=True
+        )
+
+        analyses = {}
+        for address, result in zip(addresses, results):
+            if isinstance(result, BaseException):
+                logger.error("Error analyzing token %s: %s", address, result)
+            else:
+                analyses[address] = result
+        return analyses
+
+    async def _analyze(self, token_address: str) -> SafetyAnalysis:
+        """Query all data sources for a token and cache the combined analysis."""
+        if self.repo is not None:
+            stored = await self._load_stored_analysis(token_address)
+            if stored is not None:
+                self.analysis_cache[token_address] = stored
+                return stored
+
         try:
             # Gather data from all sources
-            dex_data = await self.dex_client.get_token_data(token_address)
-            
-            # Run all checks in parallel
-            rugcheck_result, tokensniffer_result, honeypot_result = await asyncio.gather(
-                self.rugcheck_client.check_token(token_address),
-                self.tokensniffer_client.check_token(token_address),
-                self.honeypot_client.check_token(token_address)
+            dex_data = _summarize_dex_data(
+                await self.dex_client.get_token(token_address)
             )
+            
+            # Run all checks in parallel, stopping early on a critical hit
+            (
+                rugcheck_result, tokensniffer_result, honeypot_result, critical
+            ) = await self._run_checks(token_address)
 
             # Combine risk factors and determine overall risk level
             risk_factors = []
             risk_scores = []
+            mask = Risk.NONE
 
             # Add Rugcheck.xyz risks
             if rugcheck_result:
@@ -128,37 +279,45 @@ class SafetyAnalyzer:
             # Add TokenSniffer risks
             if tokensniffer_result:
                 if tokensniffer_result.is_honeypot:
-                    risk_factors.append("Potential honeypot detected by TokenSniffer")
+                    mask |= Risk.TOKENSNIFFER_HONEYPOT
                     risk_scores.append(3)
                 if tokensniffer_result.has_mint_function:
-                    risk_factors.append("Contract has mint function")
+                    mask |= Risk.MINT
                     risk_scores.append(2)
                 if tokensniffer_result.owner_balance_percent > 50:
-                    risk_factors.append(f"Owner holds {tokensniffer_result.owner_balance_percent}% of supply")
+                    mask |= Risk.OWNER_BALANCE
                     risk_scores.append(2)
                 
                 # Convert TokenSniffer score (0-100) to risk score (0-3)
-                trust_score_risk = 3 - (tokensniffer_result.trust_score / 33.33)
+                trust_score_risk = 3 - (tokensniffer_result.trust_score / _TRUST_DIV)
                 risk_scores.append(max(0, min(3, trust_score_risk)))
 
             # Add Honeypot.is risks
             if honeypot_result:
                 if honeypot_result.is_honeypot:
-                    risk_factors.append("Potential honeypot detected by Honeypot.is")
+                    mask |= Risk.HONEYPOT_IS_HONEYPOT
                     risk_scores.append(3)
                 if honeypot_result.buy_tax > 10:
-                    risk_factors.append(f"High buy tax: {honeypot_result.buy_tax}%")
+                    mask |= Risk.HIGH_BUY_TAX
                     risk_scores.append(2)
                 if honeypot_result.sell_tax > 10:
-                    risk_factors.append(f"High sell tax: {honeypot_result.sell_tax}%")
+                    mask |= Risk.HIGH_SELL_TAX
                     risk_scores.append(2)
 
+            risk_factors.extend(describe(mask, {
+                Risk.OWNER_BALANCE: tokensniffer_result and tokensniffer_result.owner_balance_percent,
+                Risk.HIGH_BUY_TAX: honeypot_result and honeypot_result.buy_tax,
+                Risk.HIGH_SELL_TAX: honeypot_result and honeypot_result.sell_tax
+            }))
+
             # Calculate overall risk level
             avg_risk = sum(risk_scores) / len(risk_scores) if risk_scores else 3
-            risk_level = "SAFE" if avg_risk < 1 else \
-                        "MEDIUM" if avg_risk < 2 else \
-                        "HIGH" if avg_risk < 2.5 else \
+            risk_level = "SAFE" if avg_risk < _SAFE else \
+                        "MEDIUM" if avg_risk < _MEDIUM else \
+                        "HIGH" if avg_risk < _HIGH else \
                         "CRITICAL"
+            if critical:
+                risk_level = "CRITICAL"
 
             # Generate detailed recommendation
             recommendation = self._generate_recommendation(
@@ -170,7 +329,7 @@ class SafetyAnalyzer:
                 dex_data
             )
 
-            return SafetyAnalysis(
+            analysis = SafetyAnalysis(
                 token_address=token_address,
                 is_safe=risk_level in ["SAFE", "MEDIUM"],
                 risk_level=risk_level,
@@ -181,13 +340,130 @@ class SafetyAnalyzer:
                 honeypot_data=honeypot_result,
                 blacklist_info=None,
                 timestamp=datetime.now(),
-                recommendation=recommendation
+                recommendation=recommendation,
+                risk_mask=mask | (rugcheck_result.risk_mask if rugcheck_result else Risk.NONE)
             )
+            self.analysis_cache[token_address] = analysis
+            if self.repo is not None:
+                # Write-behind so persisting does not delay the caller
+                task = asyncio.create_task(self._store_analysis(analysis))
+                self._pending_writes.add(task)
+                task.add_done_callback(self._pending_writes.discard)
+            return analysis
 
         except Exception as e:
-            logger.error(f"Error analyzing token {token_address}: {str(e)}")
+            logger.error("Error analyzing token %s: %s", token_address, e)
             raise
 
+    async def _run_checks(self, token_address: str) -> Tuple[
+        Optional[RugcheckResult],
+        Optional[TokenSnifferResult],
+        Optional[HoneypotResult],
+        bool
+    ]:
+        """
+        Run the provider checks concurrently, cancelling the rest on a critical hit.
+
+        A failed provider request yields None for that provider only; any other
+        error cancels the remaining checks and is raised as an ExceptionGroup.
+
+        Args:
+            token_address: Token address to check
+
+        Returns:
+            Tuple: Rugcheck, TokenSniffer and Honeypot.is results (None if
+            failed or cancelled) and whether a critical result ended the
+            checks early
+        """
+        critical = False
+        async with asyncio.TaskGroup() as tg:
+            rugcheck = tg.create_task(_provider_check(
+                "Rugcheck", self.rugcheck_client.check_token(token_address)
+            ))
+            tokensniffer = tg.create_task(_provider_check(
+                "TokenSniffer", self.tokensniffer_client.check_token(token_address)
+            ))
+            honeypot = tg.create_task(_provider_check(
+                "Honeypot.is", self.honeypot_client.check_token(token_address)
+            ))
+
+            pending = {rugcheck, tokensniffer, honeypot}
+            while pending and not critical:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                critical = any(_is_critical(task.result()) for task in done)
+
+            # The task group waits for cancelled checks to unwind on exit
+            for task in pending:
+                task.cancel()
+
+        return (
+            _result_or_none(rugcheck),
+            _result_or_none(tokensniffer),
+            _result_or_none(honeypot),
+            critical
+        )
+
+    async def _load_stored_analysis(self, token_address: str) -> Optional[SafetyAnalysis]:
+        """
+        Load a fresh analysis from the repository.
+
+        Args:
+            token_address: Token address to look up
+
+        Returns:
+            Optional[SafetyAnalysis]: Stored analysis, or None if missing or stale
+        """
+        try:
+            async with self.repo.db.get_session() as session:
+                record = await self.repo.get_token_safety(session, token_address)
+        except Exception as e:
+            logger.error("Error loading stored analysis for %s: %s", token_address, e)
+            return None
+
+        if record is None or record.last_checked is None:
+            return None
+        if datetime.utcnow() - record.last_checked > self.repo_max_age:
+            return None
+
+        metadata = record.meta or {}
+        return SafetyAnalysis(
+            token_address=token_address,
+            is_safe=record.risk_level in ["SAFE", "MEDIUM"],
+            risk_level=record.risk_level,
+            risk_factors=record.risk_factors or [],
+            dex_data=metadata.get("dex_data", {}),
+            rugcheck_data=None,
+            tokensniffer_data=None,
+            honeypot_data=None,
+            blacklist_info=record.blacklist_reason,
+            timestamp=record.last_checked,
+            recommendation=metadata.get("recommendation", "")
+        )
+
+    async def _store_analysis(self, analysis: SafetyAnalysis) -> None:
+        """
+        Persist an analysis to the repository.
+
+        Args:
+            analysis: Analysis to store
+        """
+        try:
+            async with self.repo.db.get_session() as session:
+                await self.repo.update_token_safety(
+                    session,
+                    analysis.token_address,
+                    analysis.risk_level,
+                    analysis.risk_factors,
+                    metadata={
+                        "dex_data": analysis.dex_data,
+                        "recommendation": analysis.recommendation
+                    }
+                )
+        except Exception as e:
+            logger.error("Error storing analysis for %s: %s", analysis.token_address, e)
+
     def _generate_recommendation(
         self,
         risk_level: str,
@@ -211,23 +487,16 @@ class SafetyAnalyzer:
         Returns:
             str: Detailed recommendation
         """
-        if risk_level == "CRITICAL":
-            return "DO NOT TRADE - Multiple critical risk factors detected"
+        headline = _REC_TEMPLATES.get(risk_level, _REC_TEMPLATES["SAFE"])
+        if risk_level in _FINAL_LEVELS:
+            return headline
 
-        if risk_level == "HIGH":
-            return "EXTREME CAUTION - High risk token with multiple warning signs"
-
-        recommendation_parts = []
-
-        if risk_level == "MEDIUM":
-            recommendation_parts.append("CAUTION - Trade with limited exposure")
-        else:
-            recommendation_parts.append("MODERATE RISK - Standard trading precautions apply")
+        recommendation_parts = [headline]
 
         # Add specific recommendations based on analysis
         if honeypot_result and (honeypot_result.buy_tax > 0 or honeypot_result.sell_tax > 0):
             recommendation_parts.append(
-                f"Note: Buy tax {honeypot_result.buy_tax}%, Sell tax {honeypot_result.sell_tax}%"
+                _TAX_NOTE_FMT.format(honeypot_result.buy_tax, honeypot_result.sell_tax)
             )
 
         if tokensniffer_result and tokensniffer_result.has_anti_whale:
@@ -235,7 +504,7 @@ class SafetyAnalyzer:
 
         if risk_factors:
             recommendation_parts.append("Risk factors to consider:")
-            recommendation_parts.extend(f"- {factor}" for factor in risk_factors)
+            recommendation_parts.extend("- " + factor for factor in risk_factors)
 
         return "\n".join(recommendation_parts)
 
@@ -252,8 +521,17 @@ class SafetyAnalyzer:
         return self.analysis_cache.get(token_address)
 
     def clear_cache(self) -> None:
-        """Clear all cached data."""
-        self.analysis_cache.clear()
+        """
+        Clear all cached data.
+
+        Caches are replaced with fresh instances rather than emptied in place,
+        so the call does not walk every entry while blocking the event loop.
+        """
+        self.analysis_cache = TTLCache(
+            maxsize=self.analysis_cache.maxsize,
+            ttl=self.analysis_cache.ttl,
+            timer=time.monotonic
+        )
         self.dex_client.clear_cache()
         self.rugcheck_client.clear_cache()
         self.tokensniffer_client.clear_cache()
@@ -3,18 +3,28 @@ Test module for the combined safety analyzer.
 """
 
 import asyncio
+import os
+import tempfile
 import unittest
 from datetime import datetime
-from unittest.mock import Mock, patch
-from .safety_analyzer import SafetyAnalyzer
-from .rugcheck_client import RugcheckResult
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from .blacklist_manager import BlacklistManager
+from .safety_analyzer import SafetyAnalysis, SafetyAnalyzer
+from .rugcheck_client import RugcheckClient, RugcheckResult
+from .tokensniffer_client import TokenSnifferResult
+from .honeypot_client import HoneypotResult
+from .http_pool import HttpPool, RateLimiter, coalesce
 
 class TestSafetyAnalyzer(unittest.TestCase):
     """Test cases for safety analyzer functionality."""
 
     def setUp(self):
         """Set up test cases."""
-        self.analyzer = SafetyAnalyzer()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.analyzer = SafetyAnalyzer(
+            blacklist_manager=BlacklistManager(os.path.join(tmp_dir.name, 'blacklist.json'))
+        )
 
     def create_mock_dex_data(self, is_risky: bool = False) -> dict:
         """Create mock DexScreener data."""
@@ -129,6 +139,187 @@ class TestSafetyAnalyzer(unittest.TestCase):
                           for factor in analysis.risk_factors))
         self.assertIn('Unable to complete', analysis.recommendation)
 
+    def test_parsed_result_drops_payload(self):
+        """Test that parsed results keep only summary fields."""
+        data = {
+            'contract': {'verified': True},
+            'holders': {
+                'top_holder_percentage': 25,
+                'top_holders': [{'address': '0xabc...', 'percentage': 25}]
+            }
+        }
+        result = RugcheckClient()._parse_rugcheck_response('0x123...', data)
+
+        self.assertEqual(result.raw_data, {})
+        self.assertEqual(result.holder_analysis, {'top_holder_percentage': 25})
+        self.assertIn('Top holder owns 25% of supply', result.risk_factors)
+
+    def test_stored_analysis_reused(self):
+        """Test that a fresh stored analysis is served without upstream calls."""
+        record = Mock(
+            risk_level='SAFE',
+            risk_factors=[],
+            last_checked=datetime.utcnow(),
+            blacklist_reason=None,
+            meta={'recommendation': 'MODERATE RISK'}
+        )
+        repo = MagicMock()
+        repo.get_token_safety = AsyncMock(return_value=record)
+        analyzer = SafetyAnalyzer(
+            repo=repo, blacklist_manager=self.analyzer.blacklist_manager
+        )
+
+        analysis = asyncio.run(analyzer.analyze_token('0x123...'))
+
+        self.assertTrue(analysis.is_safe)
+        self.assertEqual(analysis.recommendation, 'MODERATE RISK')
+        self.assertIs(analyzer.get_cached_analysis('0x123...'), analysis)
+
+    def test_critical_result_cancels_other_checks(self):
+        """Test that a critical provider result stops the remaining checks."""
+        async def slow_check(token_address):
+            await asyncio.sleep(10)
+
+        self.analyzer.rugcheck_client.check_token = AsyncMock(
+            return_value=self.create_mock_rugcheck_result('CRITICAL')
+        )
+        self.analyzer.tokensniffer_client.check_token = slow_check
+        self.analyzer.honeypot_client.check_token = slow_check
+
+        rugcheck, tokensniffer, honeypot, critical = asyncio.run(
+            asyncio.wait_for(self.analyzer._run_checks('0x123...'), timeout=1)
+        )
+
+        self.assertTrue(critical)
+        self.assertEqual(rugcheck.risk_level, 'CRITICAL')
+        self.assertIsNone(tokensniffer)
+        self.assertIsNone(honeypot)
+
+    def test_critical_result_cancels_upstream_requests(self):
+        """Test that cancelled checks also cancel their shared upstream requests."""
+        cancelled = []
+
+        def slow_fetch(name):
+            async def fetch(token_address):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            return fetch
+
+        self.analyzer.rugcheck_client.check_token = AsyncMock(
+            return_value=self.create_mock_rugcheck_result('CRITICAL')
+        )
+        self.analyzer.tokensniffer_client._fetch_token = slow_fetch('tokensniffer')
+        self.analyzer.honeypot_client._fetch_token = slow_fetch('honeypot')
+
+        async def run():
+            await asyncio.wait_for(self.analyzer._run_checks('0x123...'), timeout=1)
+            # Let the cancelled requests unwind, before asyncio.run cancels
+            # whatever is left on exit
+            await asyncio.sleep(0)
+            return sorted(cancelled), dict(self.analyzer.tokensniffer_client._inflight)
+
+        cancelled_before_exit, inflight = asyncio.run(run())
+
+        self.assertEqual(cancelled_before_exit, ['honeypot', 'tokensniffer'])
+        self.assertEqual(inflight, {})
+
+    def test_analyze_tokens_deduplicates(self):
+        """Test that batch analysis runs each distinct token once."""
+        analysis = SafetyAnalysis(
+            token_address='0x123...',
+            is_safe=True,
+            risk_level='SAFE',
+            risk_factors=[],
+            dex_data={},
+            rugcheck_data=None,
+            tokensniffer_data=None,
+            honeypot_data=None,
+            blacklist_info=None,
+            timestamp=datetime.now(),
+            recommendation='MODERATE RISK'
+        )
+        self.analyzer._analyze = AsyncMock(return_value=analysis)
+
+        results = asyncio.run(
+            self.analyzer.analyze_tokens(['0x123...', '0x123...', '0x456...'])
+        )
+
+        self.assertEqual(list(results), ['0x123...', '0x456...'])
+        self.assertEqual(self.analyzer._analyze.await_count, 2)
+
+    def test_analyze_tokens_end_to_end(self):
+        """Test that batch analysis combines the data from every client."""
+        self.analyzer.dex_client.get_token = AsyncMock(return_value={
+            'pairs': [
+                {'pairAddress': '0xpair1', 'liquidity': {'usd': 1000}},
+                {'pairAddress': '0xpair2', 'liquidity': {'usd': 100000}}
+            ]
+        })
+        self.analyzer.rugcheck_client.check_token = AsyncMock(
+            return_value=self.create_mock_rugcheck_result('SAFE')
+        )
+        self.analyzer.tokensniffer_client.check_token = AsyncMock(
+            return_value=TokenSnifferResult(
+                token_address='0x123...',
+                trust_score=90,
+                is_honeypot=False,
+                has_anti_whale=False,
+                has_blacklist=False,
+                has_mint_function=False,
+                owner_balance_percent=5,
+                holder_analysis={},
+                timestamp=datetime.now()
+            )
+        )
+        self.analyzer.honeypot_client.check_token = AsyncMock(
+            return_value=HoneypotResult(
+                token_address='0x123...',
+                is_honeypot=False,
+                buy_tax=2,
+                sell_tax=2,
+                max_tx_amount=None,
+                holder_analysis={},
+                simulation_success=True,
+                simulation_error=None,
+                timestamp=datetime.now()
+            )
+        )
+
+        results = asyncio.run(self.analyzer.analyze_tokens(['0x123...', '0x456...']))
+
+        self.assertEqual(list(results), ['0x123...', '0x456...'])
+        analysis = results['0x123...']
+        self.assertEqual(analysis.risk_level, 'SAFE')
+        self.assertEqual(analysis.dex_data['pairAddress'], '0xpair2')
+        self.assertEqual(analysis.rugcheck_data.risk_level, 'SAFE')
+        self.assertEqual(self.analyzer.dex_client.get_token.await_count, 2)
+
+    def test_blacklisted_token_short_circuits(self):
+        """Test that blacklisted tokens are rejected with a single lookup."""
+        manager = self.analyzer.blacklist_manager
+        self.analyzer._analyze = AsyncMock()
+
+        async def run():
+            await manager.add_to_blacklist('0xbad...', 'token', 'Rug pull')
+            await manager.add_to_blacklist('0xbad...', 'contract')
+            analysis = await self.analyzer.analyze_token('0xbad...')
+            await manager.remove_from_blacklist('0xbad...', 'token')
+            return analysis
+
+        analysis = asyncio.run(run())
+
+        self.assertEqual(analysis.risk_level, 'CRITICAL')
+        self.assertEqual(analysis.blacklist_info, 'Rug pull')
+        self.analyzer._analyze.assert_not_awaited()
+        # Still blacklisted as a contract, now without a reason
+        self.assertEqual(manager.check('0xbad...'), '')
+        self.assertIsNone(manager.check('0x123...'))
+        asyncio.run(manager.remove_from_blacklist('0xbad...', 'contract'))
+        self.assertIsNone(manager.check('0xbad...'))
+
     def test_cache_functionality(self):
         """Test analysis caching."""
         token_address = '0x123...'
@@ -147,5 +338,97 @@ class TestSafetyAnalyzer(unittest.TestCase):
         self.analyzer.clear_cache()
         self.assertIsNone(self.analyzer.get_cached_analysis(token_address))
 
+    def test_clear_cache_swaps_caches(self):
+        """Test that clearing replaces caches with empty ones of the same size."""
+        old_cache = self.analyzer.analysis_cache
+        old_cache['0x123...'] = Mock()
+        self.analyzer.rugcheck_client.cache['0x123...'] = Mock()
+
+        self.analyzer.clear_cache()
+
+        self.assertIsNot(self.analyzer.analysis_cache, old_cache)
+        self.assertEqual(len(self.analyzer.analysis_cache), 0)
+        self.assertEqual(self.analyzer.analysis_cache.maxsize, old_cache.maxsize)
+        self.assertEqual(len(self.analyzer.rugcheck_client.cache), 0)
+        self.assertEqual(len(self.analyzer.honeypot_client.cache), 0)
+
+class TestHttpPool(unittest.TestCase):
+    """Test cases for the shared HTTP pool."""
+
+    def test_rate_limiter_window(self):
+        """Test that max_calls are allowed per window and the next one waits."""
+        async def burst():
+            limiter = RateLimiter(5, 60.0)
+            for _ in range(5):
+                await asyncio.wait_for(limiter.wait(), timeout=0.1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.wait(), timeout=0.05)
+
+        asyncio.run(burst())
+
+    def test_rate_limiter_aimd(self):
+        """Test concurrency backoff on 429 and recovery on success."""
+        async def adjust():
+            limiter = RateLimiter(None, max_concurrency=8)
+            limiter.update(429, {'retry-after': '2'})
+            after_429 = limiter.concurrency
+            limiter.update(200, {})
+            return limiter, after_429
+
+        limiter, after_429 = asyncio.run(adjust())
+        self.assertEqual(after_429, 4.0)
+        self.assertEqual(limiter.concurrency, 4.5)
+        self.assertGreater(limiter._paused_until, 0)
+
+    def test_analyzer_shares_session(self):
+        """Test that the analyzer hands one session to every API client."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        blacklist_manager = BlacklistManager(os.path.join(tmp_dir.name, 'blacklist.json'))
+
+        async def enter():
+            async with SafetyAnalyzer(blacklist_manager=blacklist_manager) as analyzer:
+                sessions = {
+                    id(client.session) for client in (
+                        analyzer.dex_client,
+                        analyzer.rugcheck_client,
+                        analyzer.tokensniffer_client,
+                        analyzer.honeypot_client
+                    )
+                }
+                shared = analyzer.session
+            return sessions, shared
+
+        sessions, shared = asyncio.run(enter())
+        self.assertEqual(sessions, {id(shared)})
+        self.assertTrue(shared.closed)
+
+    def test_coalesce_duplicate_calls(self):
+        """Test that concurrent calls with the same key share one request."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        async def run():
+            inflight = {}
+            results = await asyncio.gather(
+                *(coalesce(inflight, '0x123...', fetch) for _ in range(5))
+            )
+            return results, inflight
+
+        results, inflight = asyncio.run(run())
+        self.assertEqual(results, ['result'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(inflight, {})
+
+    def test_dexscreener_rate_limit(self):
+        """Test that DexScreener requests are rate limited by default."""
+        pool = HttpPool()
+        limiter = pool._limiter('api.dexscreener.com')
+        self.assertEqual((limiter.max_calls, limiter.period), (300, 60.0))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,15 +1,20 @@
 """
 Client for interacting with TokenSniffer API.
 """
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Dict, List, Optional
+import asyncio
+import time
 import aiohttp
+from cachetools import TTLCache
 import logging
+from .data_processor import compact
+from .http_pool import coalesce, http_pool
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenSnifferResult:
     """Results from TokenSniffer analysis."""
     token_address: str
@@ -21,42 +26,37 @@ class TokenSnifferResult:
     owner_balance_percent: float
     holder_analysis: Dict
     timestamp: datetime
-    raw_data: Dict
+    raw_data: Dict = field(default_factory=dict)
 
 class TokenSnifferClient:
     """Client for interacting with TokenSniffer API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize the TokenSniffer API client.
 
         Args:
             api_key: API key for TokenSniffer
+            session: Optional shared session; defaults to the shared HTTP pool
         """
         self.base_url = "https://api.tokensniffer.com/v2"
         self.api_key = api_key
-        self.session = None
-        self.cache = {}
-        self.cache_duration = timedelta(minutes=30)
+        self._headers = {"X-API-KEY": api_key} if api_key else {}
+        self.session = session
+        self.cache = TTLCache(maxsize=10000, ttl=1800, timer=time.monotonic)
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
-        """Create aiohttp session when entering context."""
-        self.session = aiohttp.ClientSession(
-            headers={"X-API-KEY": self.api_key} if self.api_key else {}
-        )
+        """Enter context; requests go through the shared HTTP pool."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close aiohttp session when exiting context."""
-        if self.session:
-            await self.session.close()
-
-    def _is_cache_valid(self, token_address: str) -> bool:
-        """Check if cached data is still valid."""
-        if token_address not in self.cache:
-            return False
-        cache_time = self.cache[token_address].timestamp
-        return datetime.now() - cache_time < self.cache_duration
+        """Exit context; the shared HTTP pool stays open."""
+        return None
 
     async def check_token(self, token_address: str) -> TokenSnifferResult:
         """
@@ -68,25 +68,43 @@ class TokenSnifferClient:
         Returns:
             TokenSnifferResult: Analysis results
         """
-        if self._is_cache_valid(token_address):
-            return self.cache[token_address]
+        cached = self.cache.get(token_address)
+        if cached is not None:
+            return cached
+
+        # Concurrent checks of the same token share one upstream request
+        return await coalesce(
+            self._inflight, token_address, lambda: self._fetch_token(token_address)
+        )
 
+    async def _fetch_token(self, token_address: str) -> TokenSnifferResult:
+        """Fetch a token check from TokenSniffer and cache the result."""
         try:
             url = f"{self.base_url}/tokens/{token_address}"
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    logger.error(f"TokenSniffer API error: {response.status}")
-                    raise ValueError(f"TokenSniffer API error: {response.status}")
-                
-                data = await response.json()
-                result = self._parse_tokensniffer_response(token_address, data)
-                self.cache[token_address] = result
-                return result
+            try:
+                data = await http_pool.get(
+                    url,
+                    headers=self._headers,
+                    session=self.session
+                )
+            except aiohttp.ClientResponseError as e:
+                logger.error("TokenSniffer API error: %s", e.status)
+                raise ValueError(f"TokenSniffer API error: {e.status}")
+
+            result = self._parse_tokensniffer_response(token_address, data)
+            self.cache[token_address] = result
+            return result
 
         except Exception as e:
-            logger.error(f"Error checking token on TokenSniffer: {str(e)}")
+            logger.error("Error checking token on TokenSniffer: %s", e)
             raise
 
+    def clear_cache(self) -> None:
+        """Clear the API response cache by swapping in an empty one."""
+        self.cache = TTLCache(
+            maxsize=self.cache.maxsize, ttl=self.cache.ttl, timer=time.monotonic
+        )
+
     def _parse_tokensniffer_response(
         self, token_address: str, data: Dict
     ) -> TokenSnifferResult:
@@ -108,7 +126,6 @@ class TokenSnifferClient:
             has_blacklist=data.get("has_blacklist", False),
             has_mint_function=data.get("has_mint_function", False),
             owner_balance_percent=data.get("owner_balance_percent", 0.0),
-            holder_analysis=data.get("holder_analysis", {}),
-            timestamp=datetime.now(),
-            raw_data=data
+            holder_analysis=compact(data.get("holder_analysis") or {}),
+            timestamp=datetime.now()
         )
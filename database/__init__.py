@@ -1,7 +1,10 @@
 """Database package initialization."""
 from .database import Database
-from .models import User, Portfolio, Trade, TokenSafety
-from .repository import UserRepository, PortfolioRepository, TradeRepository, TokenSafetyRepository
+from .models import User, Portfolio, Trade, TokenSafety, AlertHistory
+from .repository import (
+    UserRepository, PortfolioRepository, TradeRepository, TokenSafetyRepository,
+    AlertHistoryRepository
+)
 
 __all__ = [
     'Database',
@@ -9,8 +12,10 @@ __all__ = [
     'Portfolio',
     'Trade',
     'TokenSafety',
+    'AlertHistory',
     'UserRepository',
     'PortfolioRepository',
     'TradeRepository',
-    'TokenSafetyRepository'
+    'TokenSafetyRepository',
+    'AlertHistoryRepository'
 ]
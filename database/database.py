@@ -2,12 +2,15 @@
 Database connection and management module.
 """
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from urllib.parse import quote_plus
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from contextlib import asynccontextmanager
 from cryptography.fernet import Fernet
+import aiofiles
 import logging
 
 from .models import Base
@@ -15,6 +18,21 @@ from ..config.secure_config import SecureConfig
 
 logger = logging.getLogger(__name__)
 
+# Prepared statements cached per connection (asyncpg and SQLAlchemy default: 100)
+STATEMENT_CACHE_SIZE = 1024
+
+# create_all() never alters an existing table, so portfolios tables created
+# before the (user_id, asset) upsert get their unique index here. Duplicate
+# rows would block the index; the most recently inserted one is kept.
+_PORTFOLIO_UNIQUE_DDL = (
+    "DELETE FROM portfolios a USING portfolios b "
+    "WHERE a.user_id = b.user_id AND a.asset = b.asset AND a.id < b.id",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_asset ON portfolios (user_id, asset)",
+    "DROP INDEX IF EXISTS idx_user_asset",
+)
+
+_KEY_PATH = os.path.join(os.path.dirname(__file__), '.encryption_key')
+
 class Database:
     """Database connection manager."""
 
@@ -26,39 +44,51 @@ class Database:
             config: Secure configuration instance
         """
         self.config = config
-        self.encryption_key = self._get_or_create_encryption_key()
-        self.fernet = Fernet(self.encryption_key)
+        # Loaded asynchronously by initialize()
+        self.encryption_key: Optional[bytes] = None
+        self.fernet: Optional[Fernet] = None
+        # Hot reads decrypt the same wallet addresses repeatedly
+        self._decrypt = lru_cache(maxsize=4096)(self._decrypt_uncached)
         
+        pool = config.get_pool_config()
+        self.use_pgbouncer = pool['USE_PGBOUNCER']
+
+        # asyncpg's server-side prepared statements do not survive
+        # transaction-mode PgBouncer, which hands out a different server
+        # connection per transaction
+        self.statement_cache_size = 0 if self.use_pgbouncer else STATEMENT_CACHE_SIZE
+        connect_args = {"statement_cache_size": self.statement_cache_size}
+        self._db_url = self._get_database_url()
+
         # Create async database engine
         self.engine = create_async_engine(
-            self._get_database_url(),
-            poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_recycle=1800,
+            self._db_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool['DB_POOL_SIZE'],
+            max_overflow=pool['DB_MAX_OVERFLOW'],
+            pool_timeout=pool['DB_POOL_TIMEOUT'],
+            pool_recycle=pool['DB_POOL_RECYCLE'],
+            pool_pre_ping=False,
+            connect_args=connect_args,
             echo=False
         )
         
         # Create async session factory
-        self.async_session = sessionmaker(
+        self.async_session = async_sessionmaker(
             self.engine,
-            class_=AsyncSession,
             expire_on_commit=False
         )
 
-    def _get_or_create_encryption_key(self) -> bytes:
+    async def _get_or_create_encryption_key(self) -> bytes:
         """Get or create encryption key for sensitive data."""
-        key_path = os.path.join(os.path.dirname(__file__), '.encryption_key')
-        
-        if os.path.exists(key_path):
-            with open(key_path, 'rb') as f:
-                return f.read()
+        if os.path.exists(_KEY_PATH):
+            async with aiofiles.open(_KEY_PATH, 'rb') as f:
+                return await f.read()
         
         # Generate new key if none exists
         key = Fernet.generate_key()
-        with open(key_path, 'wb') as f:
-            f.write(key)
+        async with aiofiles.open(_KEY_PATH, 'wb') as f:
+            await f.write(key)
         return key
 
     def _get_database_url(self) -> str:
@@ -69,7 +99,20 @@ class Database:
         password = self.config.get('POSTGRES_PASSWORD', '')
         database = self.config.get('POSTGRES_DB', 'deepseekerbot')
 
-        return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{database}"
+        # Credentials may contain URL-reserved characters such as '@' or '/'
+        user = quote_plus(user)
+        password = quote_plus(password)
+
+        # Size SQLAlchemy's own asyncpg prepared statement cache to match
+        return (
+            f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{database}"
+            f"?prepared_statement_cache_size={self.statement_cache_size}"
+        )
+
+    @property
+    def db_url(self) -> str:
+        """Database URL the engine was created with."""
+        return self._db_url
 
     @asynccontextmanager
     async def get_session(self) -> AsyncSession:
@@ -86,21 +129,36 @@ class Database:
                 await session.close()
 
     async def initialize(self) -> None:
-        """Initialize database tables."""
+        """Load the encryption key and initialize database tables."""
+        if self.fernet is None:
+            self.encryption_key = await self._get_or_create_encryption_key()
+            self.fernet = Fernet(self.encryption_key)
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            for statement in _PORTFOLIO_UNIQUE_DDL:
+                await conn.execute(text(statement))
 
     def encrypt_data(self, data: str) -> str:
         """Encrypt sensitive data."""
         if not data:
             return ""
-        return self.fernet.encrypt(data.encode()).decode()
+        return self._require_fernet().encrypt(data.encode()).decode()
 
     def decrypt_data(self, encrypted_data: str) -> str:
         """Decrypt sensitive data."""
         if not encrypted_data:
             return ""
-        return self.fernet.decrypt(encrypted_data.encode()).decode()
+        return self._decrypt(encrypted_data)
+
+    def _decrypt_uncached(self, encrypted_data: str) -> str:
+        """Decrypt a Fernet token without consulting the cache."""
+        return self._require_fernet().decrypt(encrypted_data.encode()).decode()
+
+    def _require_fernet(self) -> Fernet:
+        """Return the Fernet instance, which is set up by initialize()."""
+        if self.fernet is None:
+            raise RuntimeError("Database.initialize() must be awaited before encrypting data")
+        return self.fernet
 
     async def close(self) -> None:
         """Close database connection."""
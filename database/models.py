@@ -3,7 +3,7 @@ Database models for the DeepSeeker Bot.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Index, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Index, Boolean, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from cryptography.fernet import Fernet
@@ -45,9 +45,9 @@ class Portfolio(Base):
     # Relationships
     user = relationship("User", back_populates="portfolios")
 
-    # Indexes
+    # One row per user and asset; also serves as the upsert conflict target
     __table_args__ = (
-        Index('idx_user_asset', 'user_id', 'asset'),
+        UniqueConstraint('user_id', 'asset', name='uq_user_asset'),
     )
 
 class Trade(Base):
@@ -66,7 +66,8 @@ class Trade(Base):
     encrypted_tx_hash = Column(String)
     exchange = Column(String)
     pair = Column(String)
-    metadata = Column(JSON)
+    # 'metadata' is reserved on declarative classes; keep the column name
+    meta = Column('metadata', JSON, key='meta')
 
     # Relationships
     user = relationship("User", back_populates="trades")
@@ -75,6 +76,8 @@ class Trade(Base):
     __table_args__ = (
         Index('idx_user_token', 'user_id', 'token_address'),
         Index('idx_timestamp', 'timestamp'),
+        # Serves per-user history ordered newest first without a sort step
+        Index('idx_user_timestamp', 'user_id', timestamp.desc()),
     )
 
 class TokenSafety(Base):
@@ -88,10 +91,26 @@ class TokenSafety(Base):
     last_checked = Column(DateTime, default=datetime.utcnow)
     is_blacklisted = Column(Boolean, default=False)
     blacklist_reason = Column(String)
-    metadata = Column(JSON)
+    # 'metadata' is reserved on declarative classes; keep the column name
+    meta = Column('metadata', JSON, key='meta')
 
     # Indexes
     __table_args__ = (
         Index('idx_token_address', 'token_address'),
         Index('idx_risk_level', 'risk_level'),
     )
+
+class AlertHistory(Base):
+    """Model for storing sent alerts."""
+    __tablename__ = 'alert_history'
+
+    id = Column(Integer, primary_key=True)
+    alert_type = Column(String, nullable=False)
+    token_address = Column(String)
+    message = Column(String, nullable=False)
+    sent_at = Column(DateTime, default=datetime.utcnow)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_alert_sent_at', 'sent_at'),
+    )
@@ -1,14 +1,33 @@
 """
 Repository pattern implementation for database operations.
 """
-from typing import Optional, List, Dict, Any
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
-from sqlalchemy import select, update, delete
+from sqlalchemy import String, any_, bindparam, func, insert, select, update, delete
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .models import User, Portfolio, Trade, TokenSafety
+from .models import User, Portfolio, Trade, TokenSafety, AlertHistory
 from .database import Database
 
+# Hot lookups are built once so every call sends the same parametric SQL,
+# which lets asyncpg reuse its prepared statements
+_USER_BY_TELEGRAM_ID = select(User).where(User.telegram_id == bindparam("telegram_id"))
+_PORTFOLIO_BY_USER = select(Portfolio).where(Portfolio.user_id == bindparam("user_id"))
+_TOKEN_SAFETY_BY_ADDRESS = select(TokenSafety).where(
+    TokenSafety.token_address == bindparam("token_address")
+)
+# Multi-token lookups bind the whole list as one array parameter (= ANY($1)),
+# so the statement text is the same for any number of tokens
+_TOKEN_SAFETY_BY_ADDRESSES = select(TokenSafety).where(
+    TokenSafety.token_address == any_(bindparam("token_addresses", type_=ARRAY(String)))
+)
+_TRADES_FOR_TOKENS = select(Trade).where(
+    Trade.user_id == bindparam("user_id"),
+    Trade.token_address == any_(bindparam("token_addresses", type_=ARRAY(String)))
+).order_by(Trade.timestamp.desc())
+
 class Repository:
     """Base repository with common database operations."""
 
@@ -21,6 +40,34 @@ class Repository:
         """
         self.db = db
 
+    async def _run(self, query: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        """Run one query in its own session."""
+        async with self.db.get_session() as session:
+            return await query(session)
+
+    async def gather(self, *queries: Callable[[AsyncSession], Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent queries concurrently.
+
+        An AsyncSession cannot be shared between concurrent tasks, so each
+        query is given its own session. Flows that need several unrelated
+        lookups (e.g. trades, portfolio and token safety for a dashboard)
+        should fan out through this instead of awaiting them in sequence.
+
+        Example:
+            trades, portfolio = await repo.gather(
+                lambda s: trade_repo.get_user_trades(s, user_id),
+                lambda s: portfolio_repo.get_user_portfolio(s, user_id)
+            )
+
+        Args:
+            queries: Callables taking a session and returning an awaitable
+
+        Returns:
+            List[Any]: Query results in argument order
+        """
+        return await asyncio.gather(*(self._run(query) for query in queries))
+
 class UserRepository(Repository):
     """Repository for user-related operations."""
 
@@ -37,7 +84,7 @@ class UserRepository(Repository):
     async def get_user_by_telegram_id(self, session: AsyncSession, telegram_id: str) -> Optional[User]:
         """Get user by Telegram ID."""
         result = await session.execute(
-            select(User).where(User.telegram_id == telegram_id)
+            _USER_BY_TELEGRAM_ID, {"telegram_id": telegram_id}
         )
         return result.scalar_one_or_none()
 
@@ -61,35 +108,34 @@ class PortfolioRepository(Repository):
         amount: float,
         wallet_address: Optional[str] = None
     ) -> Portfolio:
-        """Update or create portfolio entry."""
-        query = select(Portfolio).where(
-            Portfolio.user_id == user_id,
-            Portfolio.asset == asset
+        """Update or create portfolio entry in a single upsert."""
+        stmt = pg_insert(Portfolio).values(
+            user_id=user_id,
+            asset=asset,
+            amount=amount,
+            encrypted_wallet_address=self.db.encrypt_data(wallet_address) if wallet_address else None
         )
-        result = await session.execute(query)
-        portfolio = result.scalar_one_or_none()
-
-        if portfolio:
-            portfolio.amount = amount
-            if wallet_address:
-                portfolio.encrypted_wallet_address = self.db.encrypt_data(wallet_address)
-        else:
-            portfolio = Portfolio(
-                user_id=user_id,
-                asset=asset,
-                amount=amount,
-                encrypted_wallet_address=self.db.encrypt_data(wallet_address) if wallet_address else None
-            )
-            session.add(portfolio)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Portfolio.user_id, Portfolio.asset],
+            set_={
+                "amount": stmt.excluded.amount,
+                # Keep the stored wallet address when none is given
+                "encrypted_wallet_address": func.coalesce(
+                    stmt.excluded.encrypted_wallet_address,
+                    Portfolio.encrypted_wallet_address
+                ),
+                "last_updated": datetime.utcnow()
+            }
+        ).returning(Portfolio)
 
-        await session.flush()
-        return portfolio
+        result = await session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
 
     async def get_user_portfolio(self, session: AsyncSession, user_id: int) -> List[Portfolio]:
         """Get user's portfolio."""
-        result = await session.execute(
-            select(Portfolio).where(Portfolio.user_id == user_id)
-        )
+        result = await session.execute(_PORTFOLIO_BY_USER, {"user_id": user_id})
         return result.scalars().all()
 
 class TradeRepository(Repository):
@@ -122,6 +168,29 @@ class TradeRepository(Repository):
         await session.flush()
         return trade
 
+    async def bulk_create_trades(self, session: AsyncSession, trades: List[Dict[str, Any]]) -> None:
+        """
+        Insert many trade records in one batched statement.
+
+        Args:
+            session: Database session
+            trades: Trade column values per trade; a 'tx_hash' key is
+                encrypted into encrypted_tx_hash
+        """
+        if not trades:
+            return
+        encrypt = self.db.encrypt_data
+        rows = [
+            {
+                **{key: value for key, value in trade.items() if key != 'tx_hash'},
+                'encrypted_tx_hash': encrypt(trade['tx_hash']) if trade.get('tx_hash') else None
+            }
+            for trade in trades
+        ]
+        # A list of parameter sets runs as a single executemany
+        await session.execute(insert(Trade), rows)
+        await session.flush()
+
     async def get_user_trades(
         self,
         session: AsyncSession,
@@ -131,6 +200,26 @@ class TradeRepository(Repository):
         end_time: Optional[datetime] = None
     ) -> List[Trade]:
         """Get user's trade history."""
+        return [
+            trade async for trade in self.iter_user_trades(
+                session, user_id, token_address, start_time, end_time
+            )
+        ]
+
+    async def iter_user_trades(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        token_address: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> AsyncIterator[Trade]:
+        """
+        Stream user's trade history, newest first.
+
+        Rows are fetched through a server-side cursor as they are consumed,
+        so callers that stop early never load the rest of the history.
+        """
         query = select(Trade).where(Trade.user_id == user_id)
         
         if token_address:
@@ -141,7 +230,24 @@ class TradeRepository(Repository):
             query = query.where(Trade.timestamp <= end_time)
             
         query = query.order_by(Trade.timestamp.desc())
-        result = await session.execute(query)
+        result = await session.stream(query)
+        try:
+            async for trade in result.scalars():
+                yield trade
+        finally:
+            await result.close()
+
+    async def get_trades_for_tokens(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        token_addresses: List[str]
+    ) -> List[Trade]:
+        """Get user's trades for several tokens in one query."""
+        result = await session.execute(
+            _TRADES_FOR_TOKENS,
+            {"user_id": user_id, "token_addresses": list(token_addresses)}
+        )
         return result.scalars().all()
 
 class TokenSafetyRepository(Repository):
@@ -157,35 +263,52 @@ class TokenSafetyRepository(Repository):
         blacklist_reason: Optional[str] = None,
         metadata: Optional[Dict] = None
     ) -> TokenSafety:
-        """Update or create token safety record."""
-        query = select(TokenSafety).where(TokenSafety.token_address == token_address)
-        result = await session.execute(query)
-        token_safety = result.scalar_one_or_none()
-
-        if token_safety:
-            token_safety.risk_level = risk_level
-            token_safety.risk_factors = risk_factors
-            token_safety.is_blacklisted = is_blacklisted
-            token_safety.blacklist_reason = blacklist_reason
-            token_safety.metadata = metadata
-            token_safety.last_checked = datetime.utcnow()
-        else:
-            token_safety = TokenSafety(
-                token_address=token_address,
-                risk_level=risk_level,
-                risk_factors=risk_factors,
-                is_blacklisted=is_blacklisted,
-                blacklist_reason=blacklist_reason,
-                metadata=metadata
-            )
-            session.add(token_safety)
+        """Update or create token safety record in a single upsert."""
+        values = {
+            "risk_level": risk_level,
+            "risk_factors": risk_factors,
+            "is_blacklisted": is_blacklisted,
+            "blacklist_reason": blacklist_reason,
+            "meta": metadata,
+            "last_checked": datetime.utcnow()
+        }
+        stmt = pg_insert(TokenSafety).values(token_address=token_address, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TokenSafety.token_address],
+            set_={key: stmt.excluded[key] for key in values}
+        ).returning(TokenSafety)
 
-        await session.flush()
-        return token_safety
+        result = await session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
 
     async def get_token_safety(self, session: AsyncSession, token_address: str) -> Optional[TokenSafety]:
         """Get token safety analysis."""
         result = await session.execute(
-            select(TokenSafety).where(TokenSafety.token_address == token_address)
+            _TOKEN_SAFETY_BY_ADDRESS, {"token_address": token_address}
         )
         return result.scalar_one_or_none()
+
+    async def get_many(self, session: AsyncSession, token_addresses: List[str]) -> List[TokenSafety]:
+        """Get token safety analyses for several tokens in one query."""
+        result = await session.execute(
+            _TOKEN_SAFETY_BY_ADDRESSES, {"token_addresses": list(token_addresses)}
+        )
+        return result.scalars().all()
+
+class AlertHistoryRepository(Repository):
+    """Repository for sent alert records."""
+
+    async def bulk_record(self, session: AsyncSession, alerts: List[Dict[str, Any]]) -> None:
+        """
+        Insert many alert records in one batched statement.
+
+        Args:
+            session: Database session
+            alerts: AlertHistory column values per alert
+        """
+        if not alerts:
+            return
+        await session.execute(insert(AlertHistory), alerts)
+        await session.flush()
@@ -5,11 +5,16 @@ This module provides configuration settings for token filters and blacklists,
 allowing users to customize their filtering criteria.
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+import copy
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Any, NamedTuple, Optional, Pattern
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-import json
 import os
+import orjson
+import re
+import sys
 
 @dataclass
 class FilterConfig:
@@ -23,6 +28,17 @@ class FilterConfig:
     max_price_impact: float = 0.10  # Maximum price impact for a standard trade
     min_dex_score: float = 0.5     # Minimum DEX trust score (0-1)
 
+class Thresholds(NamedTuple):
+    """Immutable snapshot of FilterConfig read by the filter hot path."""
+    min_market_cap: float
+    min_liquidity: float
+    min_holders: int
+    min_coin_age_days: int
+    max_holder_percentage: float
+    min_daily_volume: float
+    max_price_impact: float
+    min_dex_score: float
+
 @dataclass
 class BlacklistConfig:
     """Configuration for blacklist settings."""
@@ -38,6 +54,36 @@ class BlacklistConfig:
         self.blacklisted_contracts = self.blacklisted_contracts or []
         self.blacklist_reasons = self.blacklist_reasons or {}
 
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read and parse a config file; cached per file version."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def read_config_file(path: str) -> Dict[str, Any]:
+    """
+    Return the parsed contents of a config file.
+
+    The file is only re-read when its modification time or size changes,
+    so repeated loads of an unchanged file skip the disk read. The returned
+    data is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the configuration file
+
+    Returns:
+        Dict[str, Any]: Parsed configuration
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    stat = os.stat(path)
+    return _parse_config_file(path, stat.st_mtime_ns, stat.st_size)
+
+def clear_config_cache() -> None:
+    """Drop all cached config file contents."""
+    _parse_config_file.cache_clear()
+
 class ConfigManager:
     """Manager for filter and blacklist configurations."""
 
@@ -51,34 +97,99 @@ class ConfigManager:
         self.config_path = config_path
         self.filter_config = FilterConfig()
         self.blacklist_config = BlacklistConfig()
+        self.thresholds = Thresholds(**asdict(self.filter_config))
+        # Lookup structures derived from blacklist_config; the lists there
+        # are kept for serialization only. They are rebuilt lazily on first
+        # use after a change.
+        self._blacklist_sets: Dict[str, FrozenSet[str]] = {
+            'tokens': frozenset(),
+            'developers': frozenset()
+        }
+        self._contract_pattern: Optional[Pattern] = None
+        self._lookups_stale = True
+        # Saves requested inside batch_updates() are deferred until it exits
+        self._batch_depth = 0
+        self._dirty = False
         self.load_config()
 
     def load_config(self) -> None:
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Update filter config
-                    filter_data = data.get('filters', {})
-                    for key, value in filter_data.items():
-                        if hasattr(self.filter_config, key):
-                            setattr(self.filter_config, key, value)
-
-                    # Update blacklist config
-                    blacklist_data = data.get('blacklists', {})
-                    for key, value in blacklist_data.items():
-                        if hasattr(self.blacklist_config, key):
-                            setattr(self.blacklist_config, key, value)
+                data = read_config_file(self.config_path)
+
+                # Update filter config
+                filter_data = data.get('filters', {})
+                for key, value in filter_data.items():
+                    if hasattr(self.filter_config, key):
+                        setattr(self.filter_config, key, value)
+
+                # Update blacklist config; copy the containers, since the
+                # parsed data is cached and the blacklists are edited in place
+                blacklist_data = data.get('blacklists', {})
+                for key, value in blacklist_data.items():
+                    if hasattr(self.blacklist_config, key):
+                        setattr(self.blacklist_config, key, copy.copy(value))
             else:
                 self.save_config()  # Create default config file
         except Exception as e:
             print(f"Error loading config: {str(e)}")
             self.save_config()  # Create default config on error
+        self.thresholds = Thresholds(**asdict(self.filter_config))
+        self._lookups_stale = True
+
+    def _rebuild_lookups(self) -> None:
+        """Rebuild blacklist lookup sets and the contract pattern scanner."""
+        self._blacklist_sets = {
+            'tokens': frozenset(map(sys.intern, self.blacklist_config.blacklisted_tokens)),
+            'developers': frozenset(map(sys.intern, self.blacklist_config.blacklisted_developers))
+        }
+
+        patterns = self.blacklist_config.blacklisted_contracts
+        # Longest first, so the longest pattern wins where several start at one position
+        self._contract_pattern = re.compile(
+            "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+        ) if patterns else None
+        self._lookups_stale = False
+
+    @property
+    def blacklist_sets(self) -> Dict[str, FrozenSet[str]]:
+        """Blacklisted addresses by category ('tokens', 'developers')."""
+        if self._lookups_stale:
+            self._rebuild_lookups()
+        return self._blacklist_sets
+
+    @property
+    def contract_pattern(self) -> Optional[Pattern]:
+        """Compiled alternation of blacklisted contract patterns, if any."""
+        if self._lookups_stale:
+            self._rebuild_lookups()
+        return self._contract_pattern
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Group several updates into a single write of the config file.
+
+        Example:
+            with config_manager.batch_updates():
+                for address in addresses:
+                    config_manager.update_blacklist(address, 'tokens')
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_config()
 
     def save_config(self) -> None:
         """Save current configuration to file."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._dirty = False
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             config_data = {
@@ -100,8 +211,11 @@ class ConfigManager:
                 }
             }
             
-            with open(self.config_path, 'w') as f:
-                json.dump(config_data, f, indent=4)
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.config_path)
         except Exception as e:
             print(f"Error saving config: {str(e)}")
 
@@ -115,6 +229,7 @@ class ConfigManager:
         for key, value in new_config.items():
             if hasattr(self.filter_config, key):
                 setattr(self.filter_config, key, value)
+        self.thresholds = Thresholds(**asdict(self.filter_config))
         self.save_config()
 
     def update_blacklist(self, 
@@ -152,6 +267,7 @@ class ConfigManager:
                 if reason:
                     self.blacklist_config.blacklist_reasons[address] = reason
 
+        self._lookups_stale = True
         self.save_config()
 
     def get_blacklist_reason(self, address: str) -> str:
@@ -5,18 +5,96 @@ This module implements the filtering logic based on user-defined criteria
 and maintains blacklists for tokens, developers, and contracts.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
-from .filter_config import ConfigManager, FilterConfig, BlacklistConfig
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+import numpy as np
+from cachetools import TTLCache
+from .filter_config import (
+    ConfigManager, FilterConfig, BlacklistConfig, Thresholds, clear_config_cache
 )
+
 logger = logging.getLogger(__name__)
 
+# apply_filters calls are collected for up to BATCH_TIMEOUT seconds, or until
+# BATCH_MAX tokens are waiting, and then screened together
+BATCH_MAX = 256
+BATCH_TIMEOUT = 0.002
+
+# Failure message formatters, called with (value, threshold)
+_MARKET_CAP_LOW = "Market cap too low: ${0:,.2f} < ${1:,.2f}".format
+_LIQUIDITY_LOW = "Liquidity too low: ${0:,.2f} < ${1:,.2f}".format
+_HOLDERS_LOW = "Too few holders: {0} < {1}".format
+_TOO_NEW = "Token too new: {0} days < {1} days".format
+_HOLDER_PCT_HIGH = "Holder concentration too high: {0:.1%} > {1:.1%}".format
+_VOLUME_LOW = "Volume too low: ${0:,.2f} < ${1:,.2f}".format
+_PRICE_IMPACT_HIGH = "Price impact too high: {0:.1%} > {1:.1%}".format
+
+# Formatters for the batch filter columns, in column order
+_BATCH_REASONS = (
+    _MARKET_CAP_LOW,
+    _LIQUIDITY_LOW,
+    _HOLDERS_LOW,
+    _TOO_NEW,
+    _HOLDER_PCT_HIGH,
+    _VOLUME_LOW,
+    _PRICE_IMPACT_HIGH,
+)
+
+def _blacklisted(category: str, reason: Optional[str]) -> str:
+    """Describe a blacklist hit by category, with the stored reason if any."""
+    return f"{category} blacklisted ({reason})" if reason else f"{category} blacklisted"
+
+# A filter check returns the failure reason for a token, or None if it passes
+FilterCheck = Callable[[Dict, datetime], Optional[str]]
+
+def _build_checks(t: Thresholds) -> Tuple[FilterCheck, ...]:
+    """
+    Build the per-token filter checks with the thresholds bound in.
+
+    Args:
+        t: Current filter thresholds
+
+    Returns:
+        Tuple[FilterCheck, ...]: Checks in reporting order
+    """
+    def minimum(key: str, cast: Callable, threshold, reason: Callable) -> FilterCheck:
+        def check(token_data: Dict, now: datetime) -> Optional[str]:
+            value = cast(token_data.get(key, 0))
+            return reason(value, threshold) if value < threshold else None
+        return check
+
+    def maximum(key: str, cast: Callable, threshold, reason: Callable) -> FilterCheck:
+        def check(token_data: Dict, now: datetime) -> Optional[str]:
+            value = cast(token_data.get(key, 0))
+            return reason(value, threshold) if value > threshold else None
+        return check
+
+    def coin_age(token_data: Dict, now: datetime) -> Optional[str]:
+        creation_time = token_data.get('creation_time')
+        if creation_time:
+            age_days = (now - creation_time).days
+            if age_days < t.min_coin_age_days:
+                return _TOO_NEW(age_days, t.min_coin_age_days)
+        return None
+
+    return (
+        minimum('market_cap', float, t.min_market_cap, _MARKET_CAP_LOW),
+        minimum('liquidity', float, t.min_liquidity, _LIQUIDITY_LOW),
+        minimum('holders', int, t.min_holders, _HOLDERS_LOW),
+        coin_age,
+        maximum('max_holder_percentage', float, t.max_holder_percentage, _HOLDER_PCT_HIGH),
+        minimum('daily_volume', float, t.min_daily_volume, _VOLUME_LOW),
+        maximum('price_impact', float, t.max_price_impact, _PRICE_IMPACT_HIGH),
+    )
+
+class FilterResult(NamedTuple):
+    """Cached outcome of filtering one token."""
+    passed: bool
+    reasons: Tuple[str, ...]
+
 class FilterManager:
     """Manager for applying filters and blacklists to tokens."""
 
@@ -28,85 +106,260 @@ class FilterManager:
             config_path: Path to the configuration file
         """
         self.config_manager = ConfigManager(config_path)
-        self.filter_results_cache = {}
+        # Results expire after an hour
+        self.filter_results_cache: TTLCache = TTLCache(
+            maxsize=100_000, ttl=3600, timer=time.monotonic
+        )
+        # Per-token checks and the thresholds they were built from
+        self._checks_thresholds: Optional[Thresholds] = None
+        self._checks: Tuple[FilterCheck, ...] = ()
+        # Batching queue and worker, bound to the loop they were created on
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def apply_filters(self, token_data: Dict) -> Tuple[bool, List[str]]:
         """
         Apply all filters to a token.
 
+        Concurrent calls are queued and screened together by
+        apply_filters_batch.
+
         Args:
             token_data: Token data to filter
 
         Returns:
             Tuple[bool, List[str]]: (Passed filters?, List of failed filter reasons)
         """
-        failed_reasons = []
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_worker().put_nowait((token_data, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the batching worker.
+
+        Calls still waiting for a batch are cancelled; later apply_filters
+        calls start a new worker.
+        """
+        worker, queue = self._worker, self._queue
+        self._worker = self._queue = self._loop = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Return the batching queue, starting a worker for this loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._batch_worker(self._queue))
+        return self._queue
+
+    async def _batch_worker(self, queue: asyncio.Queue) -> None:
+        """Drain queued apply_filters calls and screen them in batches."""
+        while True:
+            batch = [await queue.get()]
+            # Give concurrent callers a moment to join the batch
+            try:
+                await asyncio.sleep(BATCH_TIMEOUT)
+            except asyncio.CancelledError:
+                batch[0][1].cancel()
+                raise
+            while len(batch) < BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            tokens = [token_data for token_data, _ in batch]
+            try:
+                results = self.apply_filters_batch(tokens)
+            except Exception:
+                # Screen one by one so a malformed token only fails its own call
+                results = []
+                now = datetime.now()
+                for token_data in tokens:
+                    try:
+                        results.append(self._filter_token(token_data, now))
+                    except Exception as e:
+                        results.append(e)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _current_checks(self) -> Tuple[FilterCheck, ...]:
+        """Return the filter checks, rebuilding them if the thresholds changed."""
+        thresholds = self.config_manager.thresholds
+        if thresholds is not self._checks_thresholds:
+            self._checks = _build_checks(thresholds)
+            self._checks_thresholds = thresholds
+        return self._checks
+
+    def _filter_token(
+        self, token_data: Dict, now: Optional[datetime] = None
+    ) -> Tuple[bool, List[str]]:
+        """
+        Apply all filters to a single token.
 
+        Args:
+            token_data: Token data to filter
+            now: Reference time for the coin age filter, so a batch of tokens
+                shares one clock read; defaults to the current time
+
+        Returns:
+            Tuple[bool, List[str]]: (Passed filters?, List of failed filter reasons)
+        """
         # Check blacklists first
         blacklist_result = self._check_blacklists(token_data)
         if blacklist_result:
-            failed_reasons.append(f"Blacklisted: {blacklist_result}")
-            return False, failed_reasons
-
-        # Apply market cap filter
-        market_cap = float(token_data.get('market_cap', 0))
-        if market_cap < self.config_manager.filter_config.min_market_cap:
-            failed_reasons.append(
-                f"Market cap too low: ${market_cap:,.2f} < ${self.config_manager.filter_config.min_market_cap:,.2f}"
-            )
+            return False, [f"Blacklisted: {blacklist_result}"]
 
-        # Apply liquidity filter
-        liquidity = float(token_data.get('liquidity', 0))
-        if liquidity < self.config_manager.filter_config.min_liquidity:
-            failed_reasons.append(
-                f"Liquidity too low: ${liquidity:,.2f} < ${self.config_manager.filter_config.min_liquidity:,.2f}"
-            )
+        now = now or datetime.now()
+        failed_reasons = [
+            reason for reason in (check(token_data, now) for check in self._current_checks())
+            if reason
+        ]
 
-        # Apply holders filter
-        holders = int(token_data.get('holders', 0))
-        if holders < self.config_manager.filter_config.min_holders:
-            failed_reasons.append(
-                f"Too few holders: {holders} < {self.config_manager.filter_config.min_holders}"
+        # Cache the results
+        self.filter_results_cache[token_data.get('address')] = FilterResult(
+            not failed_reasons, tuple(failed_reasons)
+        )
+
+        return len(failed_reasons) == 0, failed_reasons
+
+    def _failure_matrix(
+        self, tokens: List[Dict], now: datetime
+    ) -> Tuple[Tuple[np.ndarray, ...], Tuple, np.ndarray]:
+        """
+        Compare token fields against the thresholds, one column per filter.
+
+        Args:
+            tokens: Token data to filter
+            now: Reference time for the coin age filter
+
+        Returns:
+            Tuple: (field columns, thresholds, boolean failure matrix with
+            one row per token and one column per filter)
+        """
+        t = self.config_manager.thresholds
+        count = len(tokens)
+
+        def column(key: str, cast: Callable = float, dtype=np.float64) -> np.ndarray:
+            # Cast like the per-token checks so missing or malformed values
+            # raise instead of becoming NaN, which fails no comparison
+            return np.fromiter(
+                (cast(token.get(key, 0)) for token in tokens), dtype=dtype, count=count
             )
 
-        # Apply coin age filter
-        creation_time = token_data.get('creation_time')
-        if creation_time:
-            age_days = (datetime.now() - creation_time).days
-            if age_days < self.config_manager.filter_config.min_coin_age_days:
-                failed_reasons.append(
-                    f"Token too new: {age_days} days < {self.config_manager.filter_config.min_coin_age_days} days"
+        # Tokens without a creation time pass the age filter, as in apply_filters
+        age_days = np.fromiter(
+            (
+                (now - token['creation_time']).days if token.get('creation_time')
+                else t.min_coin_age_days
+                for token in tokens
+            ),
+            dtype=np.int64,
+            count=count
+        )
+        values = (
+            column('market_cap'),
+            column('liquidity'),
+            column('holders', int, np.int64),
+            age_days,
+            column('max_holder_percentage'),
+            column('daily_volume'),
+            column('price_impact'),
+        )
+        thresholds = (
+            t.min_market_cap,
+            t.min_liquidity,
+            t.min_holders,
+            t.min_coin_age_days,
+            t.max_holder_percentage,
+            t.min_daily_volume,
+            t.max_price_impact,
+        )
+        failures = np.column_stack((
+            values[0] < thresholds[0],
+            values[1] < thresholds[1],
+            values[2] < thresholds[2],
+            values[3] < thresholds[3],
+            values[4] > thresholds[4],
+            values[5] < thresholds[5],
+            values[6] > thresholds[6],
+        ))
+        return values, thresholds, failures
+
+    def apply_filters_batch(self, tokens: List[Dict]) -> List[Tuple[bool, List[str]]]:
+        """
+        Apply all filters to many tokens at once.
+
+        Token fields are gathered into one array per filter and compared
+        against the thresholds in a single vectorized pass; failure messages
+        are only formatted for tokens that fail.
+
+        Args:
+            tokens: Token data to filter
+
+        Returns:
+            List[Tuple[bool, List[str]]]: (Passed filters?, failed filter reasons)
+            per token, in input order
+        """
+        values, thresholds, failures = self._failure_matrix(tokens, datetime.now())
+        failed = failures.any(axis=1)
+
+        results = []
+        for i, token in enumerate(tokens):
+            blacklist_result = self._check_blacklists(token)
+            if blacklist_result:
+                reasons = [f"Blacklisted: {blacklist_result}"]
+            elif failed[i]:
+                reasons = [
+                    _BATCH_REASONS[j](values[j][i].item(), thresholds[j])
+                    for j in np.flatnonzero(failures[i])
+                ]
+            else:
+                reasons = []
+            results.append((not reasons, reasons))
+
+            if not blacklist_result:
+                self.filter_results_cache[token.get('address')] = FilterResult(
+                    not reasons, tuple(reasons)
                 )
 
-        # Apply holder percentage filter
-        max_holder_pct = float(token_data.get('max_holder_percentage', 0))
-        if max_holder_pct > self.config_manager.filter_config.max_holder_percentage:
-            failed_reasons.append(
-                f"Holder concentration too high: {max_holder_pct*100:.1f}% > {self.config_manager.filter_config.max_holder_percentage*100:.1f}%"
-            )
+        return results
 
-        # Apply volume filter
-        daily_volume = float(token_data.get('daily_volume', 0))
-        if daily_volume < self.config_manager.filter_config.min_daily_volume:
-            failed_reasons.append(
-                f"Volume too low: ${daily_volume:,.2f} < ${self.config_manager.filter_config.min_daily_volume:,.2f}"
-            )
+    def filter_mask(self, tokens: List[Dict]) -> np.ndarray:
+        """
+        Screen many tokens at once without building failure reasons.
 
-        # Apply price impact filter
-        price_impact = float(token_data.get('price_impact', 0))
-        if price_impact > self.config_manager.filter_config.max_price_impact:
-            failed_reasons.append(
-                f"Price impact too high: {price_impact*100:.1f}% > {self.config_manager.filter_config.max_price_impact*100:.1f}%"
-            )
+        Cheaper than apply_filters_batch when only the passing tokens are
+        needed, e.g. as a prefilter before fetching safety data. Results are
+        not cached.
 
-        # Cache the results
-        self.filter_results_cache[token_data.get('address')] = {
-            'timestamp': datetime.now(),
-            'passed': len(failed_reasons) == 0,
-            'reasons': failed_reasons
-        }
+        Args:
+            tokens: Token data to filter
 
-        return len(failed_reasons) == 0, failed_reasons
+        Returns:
+            np.ndarray: Boolean mask, True for tokens that pass every filter
+        """
+        _, _, failures = self._failure_matrix(tokens, datetime.now())
+        blacklisted = np.fromiter(
+            (self._check_blacklists(token) is not None for token in tokens),
+            dtype=bool,
+            count=len(tokens)
+        )
+        return ~(failures.any(axis=1) | blacklisted)
 
     def _check_blacklists(self, token_data: Dict) -> Optional[str]:
         """
@@ -118,21 +371,24 @@ class FilterManager:
         Returns:
             Optional[str]: Reason for blacklisting if found, None otherwise
         """
+        blacklist_sets = self.config_manager.blacklist_sets
+
         # Check token address
         token_address = token_data.get('address')
-        if token_address in self.config_manager.blacklist_config.blacklisted_tokens:
-            return self.config_manager.get_blacklist_reason(token_address) or "Token blacklisted"
+        if token_address in blacklist_sets['tokens']:
+            return _blacklisted("Token", self.config_manager.get_blacklist_reason(token_address))
 
         # Check developer address
         developer = token_data.get('developer')
-        if developer in self.config_manager.blacklist_config.blacklisted_developers:
-            return self.config_manager.get_blacklist_reason(developer) or "Developer blacklisted"
+        if developer in blacklist_sets['developers']:
+            return _blacklisted("Developer", self.config_manager.get_blacklist_reason(developer))
 
-        # Check contract patterns
-        contract_code = token_data.get('contract_code', '')
-        for pattern in self.config_manager.blacklist_config.blacklisted_contracts:
-            if pattern in contract_code:
-                return f"Blacklisted contract pattern found: {pattern}"
+        # Check contract patterns in one scan of the code
+        contract_pattern = self.config_manager.contract_pattern
+        if contract_pattern is not None:
+            match = contract_pattern.search(token_data.get('contract_code', ''))
+            if match:
+                return f"Blacklisted contract pattern found: {match.group()}"
 
         return None
 
@@ -172,10 +428,11 @@ class FilterManager:
             new_settings: Dictionary of new filter settings
         """
         self.config_manager.update_filter_config(new_settings)
+        clear_config_cache()
         logger.info("Updated filter settings")
         self.filter_results_cache.clear()  # Clear cache after settings update
 
-    def get_filter_results(self, token_address: str) -> Optional[Dict]:
+    def get_filter_results(self, token_address: str) -> Optional[FilterResult]:
         """
         Get cached filter results for a token.
 
@@ -183,9 +440,6 @@ class FilterManager:
             token_address: Token address to check
 
         Returns:
-            Optional[Dict]: Cached filter results if available
+            Optional[FilterResult]: Cached filter results if available
         """
-        result = self.filter_results_cache.get(token_address)
-        if result and (datetime.now() - result['timestamp']).seconds < 3600:  # 1 hour cache
-            return result
-        return None
+        return self.filter_results_cache.get(token_address)
@@ -3,17 +3,29 @@ Test module for filter and blacklist functionality.
 """
 
 import asyncio
+import os
+import tempfile
 import unittest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from .filter_manager import FilterManager
 from .filter_config import ConfigManager
 
-class TestFilters(unittest.TestCase):
+class TestFilters(unittest.IsolatedAsyncioTestCase):
     """Test cases for filter functionality."""
 
     def setUp(self):
         """Set up test cases."""
-        self.filter_manager = FilterManager('config/test_filter_settings.json')
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.filter_manager = FilterManager(
+            os.path.join(tmp_dir.name, 'test_filter_settings.json')
+        )
+        self.now = datetime.now()
+
+    async def asyncTearDown(self):
+        """Stop the batching worker."""
+        await self.filter_manager.close()
 
     async def test_basic_filters(self):
         """Test basic filter criteria."""
@@ -23,7 +35,7 @@ class TestFilters(unittest.TestCase):
             'market_cap': 1000000,  # $1M
             'liquidity': 100000,    # $100K
             'holders': 1000,
-            'creation_time': datetime.now() - timedelta(days=30),
+            'creation_time': self.now - timedelta(days=30),
             'max_holder_percentage': 0.05,  # 5%
             'daily_volume': 50000,  # $50K
             'price_impact': 0.02,   # 2%
@@ -41,7 +53,7 @@ class TestFilters(unittest.TestCase):
             'market_cap': 10000,    # $10K
             'liquidity': 5000,      # $5K
             'holders': 20,
-            'creation_time': datetime.now() - timedelta(hours=12),
+            'creation_time': self.now - timedelta(hours=12),
             'max_holder_percentage': 0.25,  # 25%
             'daily_volume': 1000,   # $1K
             'price_impact': 0.15,   # 15%
@@ -53,7 +65,7 @@ class TestFilters(unittest.TestCase):
         self.assertFalse(passed)
         self.assertGreater(len(reasons), 0)
 
-    def test_blacklist_functionality(self):
+    async def test_blacklist_functionality(self):
         """Test blacklist functionality."""
         # Add token to blacklist
         self.filter_manager.add_to_blacklist(
@@ -78,12 +90,9 @@ class TestFilters(unittest.TestCase):
             'developer': '0xabc...'
         }
         
-        async def check_blacklisted():
-            passed, reasons = await self.filter_manager.apply_filters(blacklisted_token)
-            self.assertFalse(passed)
-            self.assertTrue(any('blacklisted' in reason.lower() for reason in reasons))
-
-        asyncio.run(check_blacklisted())
+        passed, reasons = await self.filter_manager.apply_filters(blacklisted_token)
+        self.assertFalse(passed)
+        self.assertTrue(any('blacklisted' in reason.lower() for reason in reasons))
 
         # Test token with blacklisted developer
         token_with_bad_dev = {
@@ -94,14 +103,12 @@ class TestFilters(unittest.TestCase):
             'developer': '0xdef...'
         }
         
-        async def check_bad_dev():
-            passed, reasons = await self.filter_manager.apply_filters(token_with_bad_dev)
-            self.assertFalse(passed)
-            self.assertTrue(any('developer blacklisted' in reason.lower() for reason in reasons))
-
-        asyncio.run(check_bad_dev())
+        passed, reasons = await self.filter_manager.apply_filters(token_with_bad_dev)
+        self.assertFalse(passed)
+        self.assertTrue(any('developer blacklisted' in reason.lower() for reason in reasons))
+        self.assertIn('Blacklisted: Developer blacklisted (Multiple scam projects)', reasons)
 
-    def test_filter_settings_update(self):
+    async def test_filter_settings_update(self):
         """Test updating filter settings."""
         new_settings = {
             'min_market_cap': 200000,
@@ -117,18 +124,105 @@ class TestFilters(unittest.TestCase):
             'market_cap': 150000,   # Fails new minimum
             'liquidity': 15000,     # Fails new minimum
             'holders': 80,          # Fails new minimum
-            'creation_time': datetime.now() - timedelta(days=30),
+            'creation_time': self.now - timedelta(days=30),
             'max_holder_percentage': 0.05,
             'daily_volume': 50000,
             'price_impact': 0.02
         }
         
-        async def check_updated_settings():
-            passed, reasons = await self.filter_manager.apply_filters(token)
-            self.assertFalse(passed)
-            self.assertGreater(len(reasons), 0)
+        passed, reasons = await self.filter_manager.apply_filters(token)
+        self.assertFalse(passed)
+        self.assertGreater(len(reasons), 0)
+
+    async def test_batch_filters_match_single(self):
+        """Test that batch filtering matches per-token filtering."""
+        tokens = [
+            {
+                'address': '0xccc...',
+                'market_cap': 1000000,
+                'liquidity': 100000,
+                'holders': 1000,
+                'creation_time': self.now - timedelta(days=30),
+                'max_holder_percentage': 0.05,
+                'daily_volume': 50000,
+                'price_impact': 0.02
+            },
+            {
+                'address': '0xddd...',
+                'market_cap': 10000,
+                'liquidity': 5000,
+                'holders': 20,
+                'max_holder_percentage': 0.25,
+                'daily_volume': 1000,
+                'price_impact': 0.15
+            }
+        ]
+
+        single = [await self.filter_manager.apply_filters(token) for token in tokens]
+        self.assertEqual(self.filter_manager.apply_filters_batch(tokens), single)
+        self.assertEqual(
+            self.filter_manager.filter_mask(tokens).tolist(), [True, False]
+        )
+        cached = self.filter_manager.get_filter_results('0xddd...')
+        self.assertFalse(cached.passed)
+        self.assertIsInstance(cached.reasons, tuple)
+
+        # Missing values are rejected, not passed through as NaN
+        incomplete = dict(tokens[0], address='0xnone...', market_cap=None, liquidity=None)
+        with self.assertRaises(TypeError):
+            self.filter_manager.apply_filters_batch([incomplete])
+        with self.assertRaises(TypeError):
+            self.filter_manager.filter_mask([incomplete])
+        with self.assertRaises(TypeError):
+            await self.filter_manager.apply_filters(incomplete)
+
+    def test_batch_updates_write_once(self):
+        """Test that batched blacklist updates are saved on exit."""
+        config_manager = self.filter_manager.config_manager
+
+        with config_manager.batch_updates():
+            config_manager.update_blacklist('0xeee...', 'tokens', 'Batch import')
+            config_manager.update_blacklist('0xfff...', 'tokens')
+            # Nothing has been written yet
+            self.assertNotIn(
+                '0xeee...', ConfigManager(config_manager.config_path).blacklist_sets['tokens']
+            )
+
+        reloaded = ConfigManager(config_manager.config_path)
+        self.assertTrue({'0xeee...', '0xfff...'} <= reloaded.blacklist_sets['tokens'])
+        self.assertEqual(reloaded.get_blacklist_reason('0xeee...'), 'Batch import')
+
+    async def test_concurrent_calls_are_batched(self):
+        """Test that concurrent apply_filters calls share one batch."""
+        tokens = [
+            {
+                'address': f'0x{i}...',
+                'market_cap': 1000000,
+                'liquidity': 100000,
+                'holders': 1000,
+                'daily_volume': 50000
+            }
+            for i in range(10)
+        ]
+        tokens.append({'address': '0xbad...', 'market_cap': 'n/a'})
+
+        with patch.object(
+            self.filter_manager, 'apply_filters_batch',
+            wraps=self.filter_manager.apply_filters_batch
+        ) as batch:
+            results = await asyncio.gather(
+                *(self.filter_manager.apply_filters(token) for token in tokens),
+                return_exceptions=True
+            )
+
+        batch.assert_called_once()
+        self.assertEqual(results[:10], [(True, [])] * 10)
+        # A malformed token fails only its own call
+        self.assertIsInstance(results[10], ValueError)
 
-        asyncio.run(check_updated_settings())
+        worker = self.filter_manager._worker
+        await self.filter_manager.close()
+        self.assertTrue(worker.cancelled())
 
 if __name__ == '__main__':
     unittest.main()
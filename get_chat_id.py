@@ -1,11 +1,15 @@
+from pathlib import Path
+import orjson
 import requests
-import json
+
+# Shared session so repeated calls reuse the TLS connection to Telegram
+_SESSION = requests.Session()
 
 def get_telegram_updates(bot_token):
     url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=10)
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         if data["ok"] and data["result"]:
             # Get the most recent message
             latest_update = data["result"][-1]
@@ -27,9 +31,8 @@ def get_telegram_updates(bot_token):
 
 if __name__ == "__main__":
     # Load config to get bot token
-    with open("config.json", "r") as config_file:
-        config = json.load(config_file)
-    
+    config = orjson.loads(Path("config.json").read_bytes())
+
     bot_token = config["telegram"]["bot_token"]
     chat_id = get_telegram_updates(bot_token)
     
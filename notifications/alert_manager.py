@@ -2,19 +2,134 @@
 Alert handling and management system.
 """
 
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from database import AlertHistoryRepository
+
+logger = logging.getLogger(__name__)
+
+# Sent alerts are written to the database in batches of this size...
+FLUSH_EVERY = 50
+# ...or after this many seconds, whichever comes first
+FLUSH_INTERVAL = 5.0
+
+@dataclass(slots=True)
+class AlertRecord:
+    """Alert waiting in the queue."""
+    alert_type: str
+    data: Dict[str, Any]
+    ts: float = field(default_factory=time.time)
+
 class AlertManager:
-    def __init__(self, telegram_bot):
+    __slots__ = (
+        'telegram_bot',
+        'history_repo',
+        'alert_queue',
+        'alert_history',
+        '_pending',
+        '_flush_every',
+        '_flush_interval',
+        '_flush_task'
+    )
+
+    def __init__(
+        self,
+        telegram_bot,
+        history_repo: Optional["AlertHistoryRepository"] = None,
+        flush_every: int = FLUSH_EVERY,
+        flush_interval: float = FLUSH_INTERVAL
+    ):
+        """
+        Initialize the alert manager.
+
+        Args:
+            telegram_bot: Bot used to send alerts
+            history_repo: Optional repository to persist sent alerts to
+            flush_every: Number of sent alerts that triggers a database write
+            flush_interval: Maximum seconds a sent alert waits to be written
+        """
         self.telegram_bot = telegram_bot
-        self.alert_queue = []
+        self.history_repo = history_repo
+        self.alert_queue: Deque[AlertRecord] = deque()
         self.alert_history = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def create_alert(self, alert_type, data):
         """Create a new alert based on detected patterns."""
         raise NotImplementedError
 
     async def process_alerts(self):
-        """Process and send pending alerts."""
-        raise NotImplementedError
+        """Send pending alerts and record them for a batched history write."""
+        self._ensure_flusher()
+        while self.alert_queue:
+            alert = self.alert_queue.popleft()
+            message = alert.data.get('message') or await self.format_alert_message(alert.data)
+            await self.telegram_bot.send_alert(message)
+            if self.history_repo is None:
+                continue
+            self._pending.append({
+                'alert_type': alert.alert_type,
+                'token_address': alert.data.get('token_address'),
+                'message': message,
+                'sent_at': datetime.utcnow()
+            })
+            if len(self._pending) >= self._flush_every:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    # The batch stays pending and is retried on the next flush
+                    logger.error("Error writing alert history: %s", e)
+
+    def _ensure_flusher(self) -> None:
+        """Start the periodic flush task if history is persisted."""
+        if self.history_repo is None:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._periodic_flush())
+
+    async def _periodic_flush(self) -> None:
+        """Flush pending history every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("Error writing alert history: %s", e)
+
+    async def flush(self) -> None:
+        """
+        Write all pending alert records in one transaction.
+
+        If the write fails the records are put back, ahead of any recorded
+        meanwhile, so the next flush retries them.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            async with self.history_repo.db.get_session() as session:
+                await self.history_repo.bulk_record(session, pending)
+        except BaseException:
+            self._pending[:0] = pending
+            raise
+
+    async def close(self) -> None:
+        """Stop the periodic flush and write any remaining records."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
 
     async def format_alert_message(self, alert_data):
         """Format alert data into a readable message."""
@@ -0,0 +1,100 @@
+"""
+Cached snapshot of the services the Telegram commands report on.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from analysis.profit_loss import ProfitLossTracker
+    from filters.filter_manager import FilterManager
+
+logger = logging.getLogger(__name__)
+
+# Seconds between snapshot refreshes
+REFRESH_INTERVAL = 5.0
+
+class ServicesCache:
+    """
+    Periodically refreshed snapshot of filter settings and trading performance.
+
+    Command handlers read the last snapshot with a plain dict lookup instead
+    of querying each service per command; a background task keeps it fresh.
+    """
+
+    def __init__(
+        self,
+        filter_manager: Optional["FilterManager"] = None,
+        profit_loss_tracker: Optional["ProfitLossTracker"] = None,
+        refresh_interval: float = REFRESH_INTERVAL
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            filter_manager: Optional filter manager to report settings from
+            profit_loss_tracker: Optional tracker to report performance from
+            refresh_interval: Seconds between refreshes
+        """
+        self.filter_manager = filter_manager
+        self.profit_loss_tracker = profit_loss_tracker
+        self.refresh_interval = refresh_interval
+        self._snapshot: Dict[str, Any] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the last snapshot.
+
+        Returns:
+            Dict[str, Any]: 'filters' (threshold values), 'blacklist_count' and
+            'perf' (performance summary) for the services that are configured;
+            empty before the first refresh
+        """
+        return self._snapshot
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Rebuild the snapshot from the services.
+
+        Returns:
+            Dict[str, Any]: The new snapshot
+        """
+        snapshot: Dict[str, Any] = {}
+        if self.filter_manager is not None:
+            config_manager = self.filter_manager.config_manager
+            blacklist_sets = config_manager.blacklist_sets
+            snapshot['filters'] = config_manager.thresholds._asdict()
+            snapshot['blacklist_count'] = (
+                len(blacklist_sets['tokens']) + len(blacklist_sets['developers'])
+            )
+        if self.profit_loss_tracker is not None:
+            snapshot['perf'] = await self.profit_loss_tracker.get_performance_summary()
+        # Swap in the finished snapshot so readers never see a partial one
+        self._snapshot = snapshot
+        return snapshot
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the snapshot every refresh_interval seconds."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Error refreshing services snapshot: %s", e)
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Start refreshing in the background on the running event loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
@@ -6,33 +6,172 @@ from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 import logging
 import asyncio
+import re
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Iterable, Optional, Dict, Any
+from .services_cache import ServicesCache
+from .telegram_notifications import create_bot, send_message_limited
+
+# Concurrent sends per bot, kept below Telegram's ~30 messages/second limit
+SEND_CONCURRENCY = 25
+
+# Webhook delivery settings
+WEBHOOK_MAX_CONNECTIONS = 40
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# Command replies; only the status uptime changes between calls
+_WELCOME_TEXT = (
+    "👋 Welcome to DeepSeeker Trading Bot!\n\n"
+    "I monitor Solana tokens for trading opportunities and execute trades automatically.\n\n"
+    "Available commands:\n"
+    "/help - Show all commands\n"
+    "/status - Check bot status\n"
+    "/settings - View current settings\n"
+    "/performance - View trading performance\n"
+    "/tokens - List monitored tokens"
+)
+_HELP_TEXT = (
+    "🤖 DeepSeeker Bot Commands:\n\n"
+    "/start - Start the bot\n"
+    "/help - Show this help message\n"
+    "/status - Check bot status and statistics\n"
+    "/settings - View and modify bot settings\n"
+    "/performance - View trading performance\n"
+    "/tokens - List currently monitored tokens\n\n"
+    "The bot will automatically send alerts for:\n"
+    "- New trading opportunities\n"
+    "- Executed trades\n"
+    "- Risk alerts\n"
+    "- Performance reports"
+)
+_STATUS_PREFIX = (
+    "📊 Bot Status:\n\n"
+    "✅ Bot is running\n"
+    "⏰ Uptime: "
+)
+_STATUS_SUFFIX = (
+    "\n🔍 Monitoring:\n"
+    "- Price changes > 5%\n"
+    "- Volume spikes > 2x\n"
+    "- Minimum liquidity: $10,000\n"
+    "- Minimum volume: $1,000\n\n"
+    "📈 Recent Activity:\n"
+    "- Patterns detected today: 0\n"
+    "- Trades executed today: 0"
+)
+_SETTINGS_TEXT = (
+    "⚙️ Current Settings:\n\n"
+    "Trading Parameters:\n"
+    "- Min order size: 0.001 SOL\n"
+    "- Max order size: 0.1 SOL\n"
+    "- Stop loss: 2%\n"
+    "- Take profit: 5%\n\n"
+    "Pattern Detection:\n"
+    "- Price increase threshold: 5%\n"
+    "- Volume increase threshold: 200%\n"
+    "- Time window: 5 minutes"
+)
+_PERFORMANCE_TEXT = (
+    "📈 Performance Report:\n\n"
+    "Today's Statistics:\n"
+    "- Total trades: 0\n"
+    "- Successful trades: 0\n"
+    "- Failed trades: 0\n"
+    "- Total profit/loss: 0 SOL\n\n"
+    "Overall Statistics:\n"
+    "- Total trades: 0\n"
+    "- Win rate: 0%\n"
+    "- Average profit per trade: 0 SOL"
+)
+_FILTERS_FMT = (
+    "\n\n🛡️ Filters:\n"
+    "- Min market cap: ${min_market_cap:,.0f}\n"
+    "- Min liquidity: ${min_liquidity:,.0f}\n"
+    "- Min 24h volume: ${min_daily_volume:,.0f}\n"
+    "- Blacklisted addresses: {blacklist_count}"
+).format
+_PERFORMANCE_FMT = (
+    "📈 Performance Report:\n\n"
+    "- Total trades: {total_trades}\n"
+    "- Winning trades: {winning_trades}\n"
+    "- Total profit/loss: ${total_realized_pnl:.2f}\n"
+    "- Win rate: {win_rate:.1f}%\n"
+    "- Average profit per trade: ${average_pnl_per_trade:.2f}"
+).format
+_TOKENS_TEXT = (
+    "🔍 Monitored Tokens:\n\n"
+    "Currently monitoring all Solana tokens with:\n"
+    "- Minimum liquidity: $10,000\n"
+    "- Minimum 24h volume: $1,000\n"
+    "- Listed on major DEXes\n\n"
+    "Top tokens by volume:\n"
+    "1. SOL/USDC\n"
+    "2. BONK/USDC\n"
+    "3. JUP/USDC"
+)
+
+# Free-text keywords and their replies, highest priority first
+_KEYWORD_REPLIES = (
+    ("price", "Use /tokens to see monitored tokens and their prices."),
+    ("help", "Use /help to see all available commands."),
+)
+# All keywords in one case-insensitive pattern, so a message is scanned once
+# without making a lowercased copy
+_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword, _ in _KEYWORD_REPLIES), re.IGNORECASE
+)
 
 class TelegramBot:
     """Telegram bot for handling commands and notifications."""
 
-    def __init__(self, token: str, chat_id: str):
-        """Initialize the bot with token and chat ID."""
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        bot: Optional[Bot] = None,
+        services: Optional[ServicesCache] = None
+    ):
+        """
+        Initialize the bot.
+
+        Args:
+            token: Telegram bot token
+            chat_id: Default chat for alerts
+            bot: Optional shared Bot instance
+            services: Optional services snapshot for /status and /performance
+        """
         self.token = token
         self.chat_id = chat_id
         self.application = None
-        self.bot = None
+        self.bot = bot or create_bot(token)
+        self.services = services
+        self._send_sem = asyncio.Semaphore(SEND_CONCURRENCY)
         self._setup_logging()
 
     def _setup_logging(self):
-        """Set up logging configuration."""
-        logging.basicConfig(
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            level=logging.INFO
-        )
+        """Set up the bot logger; handlers are configured by the application."""
         self.logger = logging.getLogger(__name__)
 
-    async def setup(self):
-        """Set up the bot and register handlers."""
+    async def setup(
+        self,
+        webhook_url: Optional[str] = None,
+        listen: str = "0.0.0.0",
+        port: int = 8443
+    ):
+        """
+        Set up the bot and register handlers.
+
+        Updates are received by long polling unless a webhook URL is given,
+        in which case Telegram pushes them to a local webhook server.
+
+        Args:
+            webhook_url: Public base URL for the webhook; the bot token is
+                appended as the path
+            listen: Address for the webhook server to listen on
+            port: Port for the webhook server
+        """
         try:
-            self.application = Application.builder().token(self.token).build()
-            self.bot = Bot(self.token)
+            self.application = Application.builder().bot(self.bot).build()
 
             # Register command handlers
             self.application.add_handler(CommandHandler("start", self.start_command))
@@ -47,10 +186,28 @@ class TelegramBot:
 
             await self.application.initialize()
             await self.application.start()
-            await self.application.updater.start_polling()
+            if self.services:
+                self.services.start()
+
+            # Starting the updater and announcing the bot are independent
+            # requests once the bot is initialized, so run them together
+            async with asyncio.TaskGroup() as tg:
+                if webhook_url:
+                    tg.create_task(self.application.updater.start_webhook(
+                        listen=listen,
+                        port=port,
+                        url_path=self.token,
+                        webhook_url=f"{webhook_url.rstrip('/')}/{self.token}",
+                        allowed_updates=ALLOWED_UPDATES,
+                        max_connections=WEBHOOK_MAX_CONNECTIONS
+                    ))
+                else:
+                    tg.create_task(self.application.updater.start_polling())
+                tg.create_task(self.send_alert(
+                    "🤖 Bot is online and ready!\n\nUse /help to see available commands."
+                ))
 
             self.logger.info("Bot setup completed successfully")
-            await self.send_alert("🤖 Bot is online and ready!\n\nUse /help to see available commands.")
 
         except Exception as e:
             self.logger.error(f"Error setting up bot: {str(e)}")
@@ -58,131 +215,98 @@ class TelegramBot:
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /start command."""
-        welcome_message = (
-            "👋 Welcome to DeepSeeker Trading Bot!\n\n"
-            "I monitor Solana tokens for trading opportunities and execute trades automatically.\n\n"
-            "Available commands:\n"
-            "/help - Show all commands\n"
-            "/status - Check bot status\n"
-            "/settings - View current settings\n"
-            "/performance - View trading performance\n"
-            "/tokens - List monitored tokens"
-        )
-        await update.message.reply_text(welcome_message)
+        await update.message.reply_text(_WELCOME_TEXT)
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /help command."""
-        help_text = (
-            "🤖 DeepSeeker Bot Commands:\n\n"
-            "/start - Start the bot\n"
-            "/help - Show this help message\n"
-            "/status - Check bot status and statistics\n"
-            "/settings - View and modify bot settings\n"
-            "/performance - View trading performance\n"
-            "/tokens - List currently monitored tokens\n\n"
-            "The bot will automatically send alerts for:\n"
-            "- New trading opportunities\n"
-            "- Executed trades\n"
-            "- Risk alerts\n"
-            "- Performance reports"
-        )
-        await update.message.reply_text(help_text)
+        await update.message.reply_text(_HELP_TEXT)
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /status command."""
-        status_text = (
-            "📊 Bot Status:\n\n"
-            "✅ Bot is running\n"
-            f"⏰ Uptime: {self._get_uptime()}\n"
-            "🔍 Monitoring:\n"
-            "- Price changes > 5%\n"
-            "- Volume spikes > 2x\n"
-            "- Minimum liquidity: $10,000\n"
-            "- Minimum volume: $1,000\n\n"
-            "📈 Recent Activity:\n"
-            "- Patterns detected today: 0\n"
-            "- Trades executed today: 0"
-        )
+        status_text = _STATUS_PREFIX + self._get_uptime() + _STATUS_SUFFIX
+        snapshot = self.services.snapshot() if self.services else {}
+        if 'filters' in snapshot:
+            status_text += _FILTERS_FMT(
+                blacklist_count=snapshot['blacklist_count'], **snapshot['filters']
+            )
         await update.message.reply_text(status_text)
 
     async def settings_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /settings command."""
-        settings_text = (
-            "⚙️ Current Settings:\n\n"
-            "Trading Parameters:\n"
-            "- Min order size: 0.001 SOL\n"
-            "- Max order size: 0.1 SOL\n"
-            "- Stop loss: 2%\n"
-            "- Take profit: 5%\n\n"
-            "Pattern Detection:\n"
-            "- Price increase threshold: 5%\n"
-            "- Volume increase threshold: 200%\n"
-            "- Time window: 5 minutes"
-        )
-        await update.message.reply_text(settings_text)
+        await update.message.reply_text(_SETTINGS_TEXT)
 
     async def performance_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /performance command."""
-        performance_text = (
-            "📈 Performance Report:\n\n"
-            "Today's Statistics:\n"
-            "- Total trades: 0\n"
-            "- Successful trades: 0\n"
-            "- Failed trades: 0\n"
-            "- Total profit/loss: 0 SOL\n\n"
-            "Overall Statistics:\n"
-            "- Total trades: 0\n"
-            "- Win rate: 0%\n"
-            "- Average profit per trade: 0 SOL"
-        )
-        await update.message.reply_text(performance_text)
+        snapshot = self.services.snapshot() if self.services else {}
+        if 'perf' in snapshot:
+            await update.message.reply_text(_PERFORMANCE_FMT(**snapshot['perf']))
+        else:
+            await update.message.reply_text(_PERFORMANCE_TEXT)
 
     async def tokens_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle the /tokens command."""
-        tokens_text = (
-            "🔍 Monitored Tokens:\n\n"
-            "Currently monitoring all Solana tokens with:\n"
-            "- Minimum liquidity: $10,000\n"
-            "- Minimum 24h volume: $1,000\n"
-            "- Listed on major DEXes\n\n"
-            "Top tokens by volume:\n"
-            "1. SOL/USDC\n"
-            "2. BONK/USDC\n"
-            "3. JUP/USDC"
-        )
-        await update.message.reply_text(tokens_text)
+        await update.message.reply_text(_TOKENS_TEXT)
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming messages."""
         if not update.message or not update.message.text:
             return
 
-        text = update.message.text.lower()
-        if "price" in text:
-            await update.message.reply_text("Use /tokens to see monitored tokens and their prices.")
-        elif "help" in text:
-            await update.message.reply_text("Use /help to see all available commands.")
+        found = {match.lower() for match in _KEYWORD_RE.findall(update.message.text)}
+        for keyword, reply in _KEYWORD_REPLIES:
+            if keyword in found:
+                await update.message.reply_text(reply)
+                return
 
     def _get_uptime(self) -> str:
         """Get bot uptime."""
         # You can implement actual uptime tracking here
         return "1 hour"  # Placeholder
 
-    async def send_alert(self, message: str):
-        """Send alert message to the configured chat."""
-        try:
-            if not self.bot:
-                self.bot = Bot(self.token)
-            await self.bot.send_message(
-                chat_id=self.chat_id,
+    async def send_alert(self, message: str, chat_ids: Optional[Iterable[str]] = None):
+        """
+        Send alert message to several chats concurrently.
+
+        Args:
+            message: Alert text (HTML)
+            chat_ids: Chats to notify; defaults to the configured chat
+        """
+        chat_ids = list(chat_ids) if chat_ids is not None else [self.chat_id]
+        results = await asyncio.gather(
+            *(self._bounded_send(chat_id, message) for chat_id in chat_ids),
+            return_exceptions=True
+        )
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error sending alert to %s: %s", chat_id, result)
+
+    async def _bounded_send(self, chat_id: str, message: str):
+        """Send one message while holding a send slot."""
+        async with self._send_sem:
+            await send_message_limited(
+                self.bot,
+                chat_id=chat_id,
                 text=message,
                 parse_mode='HTML'
             )
-        except Exception as e:
-            self.logger.error(f"Error sending alert: {str(e)}")
+
+    async def setup_webhook(self, url: str, listen: str = "0.0.0.0", port: int = 8443):
+        """
+        Set up the bot to receive updates through a webhook.
+
+        Args:
+            url: Public base URL for the webhook
+            listen: Address for the webhook server to listen on
+            port: Port for the webhook server
+        """
+        await self.setup(webhook_url=url, listen=listen, port=port)
 
     async def stop(self):
         """Stop the bot."""
+        if self.services:
+            await self.services.stop()
         if self.application:
+            if self.application.updater.running:
+                await self.application.updater.stop()
             await self.application.stop()
             await self.application.shutdown()
@@ -2,31 +2,169 @@
 Telegram notifications module.
 """
 
+import asyncio
 import logging
-from typing import Optional
-from telegram import Bot
-from telegram.error import TelegramError
+import time
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Union
+from telegram import Bot, Message
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
 logger = logging.getLogger(__name__)
 
+# Concurrent sends per notifier, kept below Telegram's ~30 messages/second limit
+SEND_CONCURRENCY = 25
+
+# Keep-alive connections in a bot's HTTP pool, enough for SEND_CONCURRENCY sends
+BOT_POOL_SIZE = 32
+
+# Telegram allows about 30 messages per second per bot
+SEND_RATE = 30.0
+SEND_BURST = 30
+
+# Attempts per message when Telegram answers with RetryAfter
+MAX_SEND_ATTEMPTS = 3
+
+class TokenBucket:
+    """
+    Token bucket spacing calls at a steady rate with a bounded burst.
+
+    Each acquire() reserves a token immediately and sleeps until it is due,
+    so concurrent callers are spaced out in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens available at once
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all callers for the given time.
+
+        Args:
+            seconds: Time before the next token is handed out
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+# Message prefix per alert type
+_EMOJI_MAP = MappingProxyType({
+    "general": "ℹ️",
+    "warning": "⚠️",
+    "error": "❌",
+    "success": "✅"
+})
+
+@lru_cache(maxsize=256)
+def _format_alert(alert_type: str, message: str) -> str:
+    """Prefix an alert message with the emoji for its type."""
+    return f"{_EMOJI_MAP.get(alert_type, 'ℹ️')} {message}"
+
+# One bucket per bot token, since Telegram's limit applies per bot
+_limiters: Dict[str, TokenBucket] = {}
+
+def send_limiter(bot: Bot) -> TokenBucket:
+    """Return the send rate limiter shared by every user of a bot."""
+    limiter = _limiters.get(bot.token)
+    if limiter is None:
+        limiter = _limiters[bot.token] = TokenBucket(SEND_RATE, SEND_BURST)
+    return limiter
+
+def _seconds(value: Union[int, float, timedelta]) -> float:
+    """Convert a RetryAfter delay to seconds."""
+    return value.total_seconds() if isinstance(value, timedelta) else float(value)
+
+async def send_message_limited(bot: Bot, **kwargs) -> Message:
+    """
+    Send a message within the bot's rate limit, retrying on flood control.
+
+    On RetryAfter the bot's limiter is paused for the requested time, so
+    other pending sends back off too, and the message is sent again.
+
+    Args:
+        bot: Bot to send with
+        **kwargs: Arguments for Bot.send_message
+
+    Returns:
+        Message: The sent message
+
+    Raises:
+        TelegramError: If sending fails, or RetryAfter persists after
+            MAX_SEND_ATTEMPTS attempts
+    """
+    limiter = send_limiter(bot)
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        await limiter.acquire()
+        try:
+            return await bot.send_message(**kwargs)
+        except RetryAfter as e:
+            if attempt == MAX_SEND_ATTEMPTS:
+                raise
+            delay = _seconds(e.retry_after)
+            logger.warning("Telegram flood control, retrying in %.1fs", delay)
+            limiter.pause(delay)
+
+def create_bot(token: str) -> Bot:
+    """
+    Create a Bot with a connection pool sized for concurrent sends.
+
+    Share the returned instance between TelegramBot and TelegramNotifier so
+    all sends reuse the same keep-alive connections.
+
+    Args:
+        token: Telegram bot token
+
+    Returns:
+        Bot: New bot instance
+    """
+    return Bot(token=token, request=HTTPXRequest(connection_pool_size=BOT_POOL_SIZE))
+
 class TelegramNotifier:
     """Handles Telegram notifications."""
     
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, bot_token: str, chat_id: str, bot: Optional[Bot] = None):
         """
         Initialize TelegramNotifier.
 
         Args:
             bot_token: Telegram bot token
             chat_id: Target chat ID
+            bot: Optional shared Bot instance; one is created if not given
         """
-        self.bot = Bot(token=bot_token)
+        self.bot = bot or create_bot(bot_token)
         self.chat_id = chat_id
+        self._send_sem = asyncio.Semaphore(SEND_CONCURRENCY)
 
     async def send_notification(
         self,
         message: str,
-        parse_mode: Optional[str] = None
+        parse_mode: Optional[str] = None,
+        chat_ids: Optional[Iterable[str]] = None
     ) -> bool:
         """
         Send notification via Telegram.
@@ -34,20 +172,36 @@ class TelegramNotifier:
         Args:
             message: Message to send
             parse_mode: Optional parse mode (HTML/Markdown)
+            chat_ids: Chats to notify concurrently; defaults to the configured chat
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if sent to every chat, False otherwise
         """
+        chat_ids = list(chat_ids) if chat_ids is not None else [self.chat_id]
+        results = await asyncio.gather(
+            *(self._bounded_send(chat_id, message, parse_mode) for chat_id in chat_ids)
+        )
+        return all(results)
+
+    async def _bounded_send(
+        self,
+        chat_id: str,
+        message: str,
+        parse_mode: Optional[str]
+    ) -> bool:
+        """Send one message while holding a send slot."""
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode
-            )
+            async with self._send_sem:
+                await send_message_limited(
+                    self.bot,
+                    chat_id=chat_id,
+                    text=message,
+                    parse_mode=parse_mode
+                )
             return True
             
         except TelegramError as e:
-            logger.error(f"Failed to send Telegram notification: {str(e)}")
+            logger.error("Failed to send Telegram notification to %s: %s", chat_id, e)
             return False
 
     async def send_alert(
@@ -65,15 +219,4 @@ class TelegramNotifier:
         Returns:
             bool: True if successful, False otherwise
         """
-        # Add emoji based on alert type
-        emoji_map = {
-            "general": "ℹ️",
-            "warning": "⚠️",
-            "error": "❌",
-            "success": "✅"
-        }
-        
-        emoji = emoji_map.get(alert_type, "ℹ️")
-        formatted_message = f"{emoji} {message}"
-        
-        return await self.send_notification(formatted_message)
+        return await self.send_notification(_format_alert(alert_type, message))
@@ -0,0 +1,137 @@
+"""
+Test module for alert batching and history persistence.
+"""
+
+import asyncio
+import time
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, AsyncMock
+from .alert_manager import AlertManager, AlertRecord
+
+class FakeHistoryRepository:
+    """Alert history repository that keeps written batches in memory."""
+
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+        self.db = Mock()
+        self.db.get_session = self._get_session
+
+    @asynccontextmanager
+    async def _get_session(self):
+        yield Mock()
+
+    async def bulk_record(self, session, records):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(records))
+
+class TestAlertRecord(unittest.TestCase):
+    """Test cases for queued alert records."""
+
+    def test_defaults_timestamp(self):
+        """Test that a record is stamped with its creation time."""
+        before = time.time()
+        record = AlertRecord('pump', {'message': 'Pump detected'})
+
+        self.assertEqual(record.alert_type, 'pump')
+        self.assertEqual(record.data, {'message': 'Pump detected'})
+        self.assertGreaterEqual(record.ts, before)
+        self.assertLessEqual(record.ts, time.time())
+
+    def test_uses_slots(self):
+        """Test that records carry no per-instance __dict__."""
+        record = AlertRecord('pump', {})
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.extra = True
+
+class TestAlertManager(unittest.IsolatedAsyncioTestCase):
+    """Test cases for sending alerts and batching their history."""
+
+    def setUp(self):
+        """Set up test cases."""
+        self.telegram_bot = Mock()
+        self.telegram_bot.send_alert = AsyncMock()
+        self.repo = FakeHistoryRepository()
+
+    def _manager(self, **kwargs) -> AlertManager:
+        """Build a manager whose flush task is stopped after the test."""
+        manager = AlertManager(self.telegram_bot, self.repo, **kwargs)
+        self.addAsyncCleanup(manager.close)
+        return manager
+
+    def _queue(self, manager: AlertManager, count: int) -> None:
+        """Queue count alerts with distinct messages."""
+        for i in range(count):
+            manager.alert_queue.append(AlertRecord('pump', {
+                'message': f'alert {i}',
+                'token_address': f'0x{i}'
+            }))
+
+    async def test_flushes_every_n_alerts(self):
+        """Test that a full batch is written as soon as it is reached."""
+        manager = self._manager(flush_every=2, flush_interval=60)
+        self._queue(manager, 5)
+
+        await manager.process_alerts()
+
+        self.assertEqual(self.telegram_bot.send_alert.await_count, 5)
+        self.assertEqual(
+            [[r['message'] for r in batch] for batch in self.repo.batches],
+            [['alert 0', 'alert 1'], ['alert 2', 'alert 3']]
+        )
+        self.assertEqual([r['message'] for r in manager._pending], ['alert 4'])
+
+        await manager.close()
+        self.assertEqual(self.repo.batches[-1][0]['token_address'], '0x4')
+        self.assertEqual(manager._pending, [])
+
+    async def test_flushes_after_interval(self):
+        """Test that a partial batch is written by the periodic flush."""
+        manager = self._manager(flush_every=50, flush_interval=0.01)
+        self._queue(manager, 3)
+
+        await manager.process_alerts()
+        self.assertEqual(self.repo.batches, [])
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.repo.batches), 1)
+        self.assertEqual(len(self.repo.batches[0]), 3)
+
+    async def test_failed_flush_keeps_records(self):
+        """Test that a batch whose write fails is retried on the next flush."""
+        manager = self._manager(flush_every=2, flush_interval=60)
+        self.repo.fail = True
+        self._queue(manager, 3)
+
+        await manager.process_alerts()
+
+        self.assertEqual(self.telegram_bot.send_alert.await_count, 3)
+        self.assertEqual(
+            [r['message'] for r in manager._pending],
+            ['alert 0', 'alert 1', 'alert 2']
+        )
+
+        self.repo.fail = False
+        await manager.flush()
+        self.assertEqual(len(self.repo.batches), 1)
+        self.assertEqual(len(self.repo.batches[0]), 3)
+        self.assertEqual(manager._pending, [])
+
+    async def test_close_stops_flush_task(self):
+        """Test that close waits for the periodic flush task to finish."""
+        manager = self._manager(flush_interval=60)
+        self._queue(manager, 1)
+        await manager.process_alerts()
+        task = manager._flush_task
+
+        await manager.close()
+
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(manager._flush_task)
+        self.assertEqual(len(self.repo.batches), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Test module for the services snapshot cache.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, AsyncMock
+from telegram import Bot, Update
+from filters.filter_manager import FilterManager
+from .services_cache import ServicesCache
+from .telegram_bot import TelegramBot
+
+class StubProfitLossTracker:
+    """Tracker returning a fixed performance summary."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_performance_summary(self):
+        self.calls += 1
+        return {
+            'total_realized_pnl': 250.5,
+            'total_trades': 4,
+            'winning_trades': 3,
+            'win_rate': 75.0,
+            'average_pnl_per_trade': 62.625
+        }
+
+class TestServicesCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the services snapshot cache."""
+
+    def setUp(self):
+        """Set up test cases."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.filter_manager = FilterManager(
+            os.path.join(tmp_dir.name, 'filter_settings.json')
+        )
+        self.filter_manager.update_filter_settings({
+            'min_market_cap': 250000,
+            'min_liquidity': 20000,
+            'min_daily_volume': 7500
+        })
+        self.filter_manager.add_to_blacklist('0xbad...', 'tokens', 'Rug pull')
+        self.tracker = StubProfitLossTracker()
+        self.cache = ServicesCache(
+            filter_manager=self.filter_manager,
+            profit_loss_tracker=self.tracker,
+            refresh_interval=0.01
+        )
+
+        self.bot = TelegramBot(
+            token="test_token",
+            chat_id="test_chat_id",
+            bot=AsyncMock(spec=Bot),
+            services=self.cache
+        )
+        self.mock_update = Mock(spec=Update)
+        self.mock_update.message.reply_text = AsyncMock()
+
+    async def asyncTearDown(self):
+        """Stop any background refresh."""
+        await self.cache.stop()
+        await self.filter_manager.close()
+
+    def _reply(self) -> str:
+        """Return the text of the single reply sent."""
+        self.mock_update.message.reply_text.assert_called_once()
+        return self.mock_update.message.reply_text.call_args[0][0]
+
+    async def test_refresh_builds_snapshot(self):
+        """Test that refresh reads the filter settings and performance."""
+        self.assertEqual(self.cache.snapshot(), {})
+
+        snapshot = await self.cache.refresh()
+
+        self.assertIs(self.cache.snapshot(), snapshot)
+        self.assertEqual(snapshot['filters']['min_market_cap'], 250000)
+        self.assertEqual(snapshot['blacklist_count'], 1)
+        self.assertEqual(snapshot['perf']['total_trades'], 4)
+
+    async def test_status_reply(self):
+        """Test the /status text built from the snapshot."""
+        await self.cache.refresh()
+
+        await self.bot.status_command(self.mock_update, None)
+
+        reply = self._reply()
+        self.assertIn(
+            "🛡️ Filters:\n"
+            "- Min market cap: $250,000\n"
+            "- Min liquidity: $20,000\n"
+            "- Min 24h volume: $7,500\n"
+            "- Blacklisted addresses: 1",
+            reply
+        )
+
+    async def test_performance_reply(self):
+        """Test the /performance text built from the snapshot."""
+        await self.cache.refresh()
+
+        await self.bot.performance_command(self.mock_update, None)
+
+        self.assertEqual(
+            self._reply(),
+            "📈 Performance Report:\n\n"
+            "- Total trades: 4\n"
+            "- Winning trades: 3\n"
+            "- Total profit/loss: $250.50\n"
+            "- Win rate: 75.0%\n"
+            "- Average profit per trade: $62.62"
+        )
+
+    async def test_background_refresh_and_stop(self):
+        """Test that start refreshes periodically and stop cancels the task."""
+        self.cache.start()
+        task = self.cache._refresh_task
+        await asyncio.sleep(0.05)
+
+        self.assertIn('perf', self.cache.snapshot())
+        self.assertGreater(self.tracker.calls, 1)
+
+        await self.cache.stop()
+        self.assertTrue(task.cancelled())
+        self.assertIsNone(self.cache._refresh_task)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,120 +3,79 @@ Test module for Telegram bot functionality.
 """
 
 import unittest
-from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timedelta
-from decimal import Decimal
-from telegram import Update, Chat, Message, User
+from unittest.mock import Mock, AsyncMock
+from telegram import Bot, Update
 from telegram.ext import CallbackContext
+from .services_cache import ServicesCache
 from .telegram_bot import TelegramBot
 
-class TestTelegramBot(unittest.TestCase):
+class TestTelegramBot(unittest.IsolatedAsyncioTestCase):
     """Test cases for Telegram bot functionality."""
 
     def setUp(self):
         """Set up test cases."""
         self.mock_filter_manager = Mock()
+        self.mock_filter_manager.config_manager.thresholds._asdict.return_value = {
+            'min_market_cap': 100000,
+            'min_liquidity': 1000,
+            'min_daily_volume': 5000
+        }
+        self.mock_filter_manager.config_manager.blacklist_sets = {
+            'tokens': {'0x123'},
+            'developers': {'0x456'}
+        }
         self.mock_profit_loss_tracker = Mock()
         self.mock_profit_loss_tracker.get_performance_summary = AsyncMock()
-        
+
+        # Inject a mocked Bot so no HTTP client is built and nothing hits the network
+        self.mock_telegram_bot = AsyncMock(spec=Bot)
         self.bot = TelegramBot(
             token="test_token",
-            filter_manager=self.mock_filter_manager,
-            profit_loss_tracker=self.mock_profit_loss_tracker
-        )
-        
-        # Mock update object
-        self.mock_user = User(id=1, is_bot=False, first_name="Test", username="test_user")
-        self.mock_chat = Chat(id=1, type="private")
-        self.mock_message = Message(
-            message_id=1,
-            date=datetime.now(),
-            chat=self.mock_chat,
-            from_user=self.mock_user
+            chat_id="test_chat_id",
+            bot=self.mock_telegram_bot,
+            services=ServicesCache(
+                filter_manager=self.mock_filter_manager,
+                profit_loss_tracker=self.mock_profit_loss_tracker
+            )
         )
-        self.mock_update = Update(update_id=1, message=self.mock_message)
-        
+
+        # Mock update object; PTB objects are immutable, so the reply is mocked
+        self.mock_message = Mock()
+        self.mock_message.reply_text = AsyncMock()
+        self.mock_update = Mock(spec=Update)
+        self.mock_update.message = self.mock_message
+
         # Mock context
         self.mock_context = Mock(spec=CallbackContext)
 
     async def test_start_command(self):
         """Test the start command."""
-        self.mock_message.reply_text = AsyncMock()
-        
         await self.bot.start_command(self.mock_update, self.mock_context)
-        
+
         self.mock_message.reply_text.assert_called_once()
         call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("Welcome to DeepSeeker Bot", call_args)
-        self.assertIn("/subscribe", call_args)
+        self.assertIn("Welcome to DeepSeeker Trading Bot", call_args)
+        self.assertIn("/help", call_args)
 
     async def test_help_command(self):
         """Test the help command."""
-        self.mock_message.reply_text = AsyncMock()
-        
         await self.bot.help_command(self.mock_update, self.mock_context)
-        
-        self.mock_message.reply_text.assert_called_once()
-        call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("DeepSeeker Bot Commands", call_args)
-        self.assertIn("Filter Management", call_args)
-
-    async def test_subscribe_command(self):
-        """Test the subscribe command."""
-        self.mock_message.reply_text = AsyncMock()
-        
-        # Test new subscription
-        await self.bot.subscribe_command(self.mock_update, self.mock_context)
-        
-        self.mock_message.reply_text.assert_called_once()
-        self.assertIn(self.mock_chat.id, self.bot.alert_subscribers)
-        call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("subscribed", call_args.lower())
-        
-        # Test already subscribed
-        self.mock_message.reply_text.reset_mock()
-        await self.bot.subscribe_command(self.mock_update, self.mock_context)
-        
-        self.mock_message.reply_text.assert_called_once()
-        call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("already subscribed", call_args.lower())
 
-    async def test_unsubscribe_command(self):
-        """Test the unsubscribe command."""
-        self.mock_message.reply_text = AsyncMock()
-        
-        # Add subscriber first
-        self.bot.alert_subscribers.add(self.mock_chat.id)
-        
-        # Test unsubscribe
-        await self.bot.unsubscribe_command(self.mock_update, self.mock_context)
-        
-        self.mock_message.reply_text.assert_called_once()
-        self.assertNotIn(self.mock_chat.id, self.bot.alert_subscribers)
-        call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("unsubscribed", call_args.lower())
-        
-        # Test already unsubscribed
-        self.mock_message.reply_text.reset_mock()
-        await self.bot.unsubscribe_command(self.mock_update, self.mock_context)
-        
         self.mock_message.reply_text.assert_called_once()
         call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("not currently subscribed", call_args.lower())
+        self.assertIn("DeepSeeker Bot Commands", call_args)
+        self.assertIn("/performance", call_args)
 
     async def test_status_command(self):
         """Test the status command."""
-        self.mock_message.reply_text = AsyncMock()
-        self.mock_filter_manager.get_current_filters.return_value = {'min_liquidity': 1000}
-        self.mock_filter_manager.get_blacklist.return_value = ['0x123', '0x456']
-        
+        await self.bot.services.refresh()
         await self.bot.status_command(self.mock_update, self.mock_context)
-        
+
         self.mock_message.reply_text.assert_called_once()
         call_args = self.mock_message.reply_text.call_args[0][0]
-        self.assertIn("DeepSeeker Bot Status", call_args)
-        self.assertIn("Active Filters: 1", call_args)
-        self.assertIn("Blacklisted Addresses: 2", call_args)
+        self.assertIn("Bot Status", call_args)
+        self.assertIn("Min liquidity: $1,000", call_args)
+        self.assertIn("Blacklisted addresses: 2", call_args)
 
     async def test_performance_command(self):
         """Test the performance command."""
@@ -127,76 +86,31 @@ class TestTelegramBot(unittest.TestCase):
             'win_rate': 70.0,
             'average_pnl_per_trade': 100.0
         }
-        
-        self.bot.application = Mock()
-        self.bot.application.bot.send_message = AsyncMock()
-        
+        await self.bot.services.refresh()
+
         await self.bot.performance_command(self.mock_update, self.mock_context)
-        
-        self.bot.application.bot.send_message.assert_called_once()
-        call_args = self.bot.application.bot.send_message.call_args[0][1]
-        self.assertIn("Trading Performance Report", call_args)
-        self.assertIn("$1,000.00", call_args)
+
+        self.mock_message.reply_text.assert_called_once()
+        call_args = self.mock_message.reply_text.call_args[0][0]
+        self.assertIn("Performance Report", call_args)
+        self.assertIn("$1000.00", call_args)
         self.assertIn("70.0%", call_args)
 
     async def test_send_alert(self):
         """Test sending alerts."""
-        self.bot.application = Mock()
-        self.bot.application.bot.send_message = AsyncMock()
-        
-        # Add a subscriber
-        self.bot.alert_subscribers.add(self.mock_chat.id)
-        
-        # Test different alert types
-        alert_types = {
-            "general": "ℹ️",
-            "rugpull": "🚨",
-            "pump": "📈",
-            "cex": "📱",
-            "performance": "📊"
-        }
-        
-        for alert_type, emoji in alert_types.items():
-            await self.bot.send_alert("Test message", alert_type)
-            
-            self.bot.application.bot.send_message.assert_called()
-            call_args = self.bot.application.bot.send_message.call_args[0][1]
-            self.assertIn(emoji, call_args)
-            self.assertIn("Test message", call_args)
-            
-            self.bot.application.bot.send_message.reset_mock()
-
-    async def test_periodic_performance_report(self):
-        """Test periodic performance report."""
-        self.bot.application = Mock()
-        self.bot.application.bot.send_message = AsyncMock()
-        self.mock_profit_loss_tracker.get_performance_summary.return_value = {
-            'total_realized_pnl': 1000.0,
-            'total_trades': 10,
-            'winning_trades': 7,
-            'win_rate': 70.0,
-            'average_pnl_per_trade': 100.0
+        await self.bot.send_alert("Test message")
+        self.mock_telegram_bot.send_message.assert_awaited_once_with(
+            chat_id="test_chat_id", text="Test message", parse_mode='HTML'
+        )
+
+        # Several chats are sent to concurrently
+        self.mock_telegram_bot.send_message.reset_mock()
+        await self.bot.send_alert("Test message", chat_ids=["1", "2"])
+        sent_to = {
+            call.kwargs['chat_id']
+            for call in self.mock_telegram_bot.send_message.await_args_list
         }
-        
-        # Add a subscriber
-        self.bot.alert_subscribers.add(self.mock_chat.id)
-        
-        # Set last report to trigger immediate report
-        self.bot.last_performance_report = datetime.now() - timedelta(hours=25)
-        
-        # Run one iteration
-        try:
-            await asyncio.wait_for(
-                self.bot.periodic_performance_report(),
-                timeout=1
-            )
-        except asyncio.TimeoutError:
-            pass
-        
-        self.bot.application.bot.send_message.assert_called_once()
-        call_args = self.bot.application.bot.send_message.call_args[0][1]
-        self.assertIn("Trading Performance Report", call_args)
-        self.assertIn("$1,000.00", call_args)
+        self.assertEqual(sent_to, {"1", "2"})
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the end-to-end tests.
+
+The configuration is loaded once per test session; mocks, trackers and
+analyzers hold state, so every test gets fresh ones.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from trading.hummingbot_client import HummingbotClient
+from analysis.volume_analyzer import VolumeAnalyzer
+from analysis.profit_loss import ProfitLossTracker
+from data_parsing.safety_analyzer import SafetyAnalyzer
+from config.settings import load_config
+
+@pytest.fixture(scope='session')
+def event_loop_policy():
+    """Run the async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+@pytest.fixture(scope='session')
+def config():
+    """Load configuration."""
+    return load_config()
+
+@pytest.fixture
+def mock_telegram():
+    """Mock Telegram bot."""
+    telegram = Mock()
+    telegram.send_alert = AsyncMock()
+    return telegram
+
+@pytest.fixture
+def telegram_notifier():
+    """Mock Telegram notifier."""
+    notifier = Mock()
+    notifier.send_message = AsyncMock()
+    notifier.send_error = AsyncMock()
+    notifier.send_performance_report = AsyncMock()
+    return notifier
+
+@pytest.fixture
+def volume_analyzer():
+    """Volume analyzer."""
+    return VolumeAnalyzer()
+
+@pytest.fixture
+def profit_loss(telegram_notifier):
+    """Profit/loss tracker reporting to the mock notifier."""
+    return ProfitLossTracker(telegram_notifier=telegram_notifier)
+
+@pytest.fixture
+def safety_analyzer(config):
+    """Safety analyzer."""
+    return SafetyAnalyzer(
+        rugcheck_api_key=config['exchanges']['binance']['api_key']
+    )
+
+@pytest.fixture
+def hummingbot(config, mock_telegram):
+    """Hummingbot client notifying the mock Telegram bot."""
+    return HummingbotClient(config=config, telegram_bot=mock_telegram)
@@ -7,50 +7,163 @@ based on identified patterns and signals.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
-import json
 import os
-import subprocess
+import py_compile
+import re
 from pathlib import Path
+import aiofiles
 import aiohttp
+import orjson
+from data_parsing.http_pool import http_pool
 from notifications.telegram_bot import TelegramBot
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for Hummingbot to exit before killing it
+STOP_TIMEOUT = 5.0
+
+# Longest console line read from Hummingbot before the reader gives up
+OUTPUT_LINE_LIMIT = 1 << 20
+
+# Alerts queued within this many seconds of each other go out as one message
+ALERT_COALESCE_WINDOW = 0.25
+ALERT_SEPARATOR = "\n---\n"
+
+# Trade fill notification
+_BUY_EMOJI = "🟢"
+_SELL_EMOJI = "🔴"
+_TRADE_MSG = (
+    "{emoji} {type} Order Filled\n\n"
+    "Symbol: {symbol}\n"
+    "Amount: {amount:.8f}\n"
+    "Price: ${price:.2f}\n"
+    "Total: ${total:.2f}"
+).format
+
+# Wait between reads at the end of the log, doubling while it stays idle
+LOG_POLL_MIN = 0.05
+LOG_POLL_MAX = 1.0
+
+# Log events of interest, found in one scan per raw line
+_EVENT_RE = re.compile(rb"OrderFilledEvent|ERROR")
+# e.g. b"2023-01-01 12:00:00 - OrderFilledEvent BUY BTC-USDT 0.1 @ 50000.00"
+_TRADE_RE = re.compile(rb"OrderFilledEvent\s+(BUY|SELL)\s+(\S+)\s+(\S+)\s+@\s+(\S+)")
+
+@dataclass(slots=True)
+class HbSettings:
+    """Configuration values used by the Hummingbot client, read once from the config."""
+    instance_path: Path
+    default_exchange: str
+    default_market: str
+    min_order_size: float
+    max_order_size: float
+    stop_loss_pct: float
+    take_profit_pct: float
+    telegram_token: str
+    telegram_chat_id: str
+    exchanges: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HbSettings":
+        """
+        Extract the client settings from the configuration.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            HbSettings: Flattened settings
+        """
+        trading = config['trading']
+        hummingbot = config['hummingbot']
+        return cls(
+            instance_path=Path(hummingbot['instance_path']),
+            default_exchange=hummingbot['default_exchange'],
+            default_market=hummingbot['default_market'],
+            min_order_size=trading['min_order_size'],
+            max_order_size=trading['max_order_size'],
+            stop_loss_pct=trading['stop_loss_pct'],
+            take_profit_pct=trading['take_profit_pct'],
+            telegram_token=config['telegram']['bot_token'],
+            telegram_chat_id=config['telegram']['chat_id'],
+            exchanges=config['exchanges']
+        )
+
+def _log_rotated(log_file: Path, inode: int, position: int) -> bool:
+    """
+    Check whether the log file was replaced or truncated.
+
+    Args:
+        log_file: Path of the followed log
+        inode: Inode of the open handle
+        position: Read position of the open handle
+
+    Returns:
+        bool: True if the log should be reopened
+    """
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        # Mid-rotation; keep reading the old file until the new one appears
+        return False
+    return stat.st_ino != inode or stat.st_size < position
+
 class HummingbotClient:
     """Client for interacting with Hummingbot."""
 
-    def __init__(self, config: Dict, telegram_bot: TelegramBot):
+    def __init__(
+        self,
+        config: Dict,
+        telegram_bot: TelegramBot,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize Hummingbot client.
 
         Args:
             config: Configuration dictionary
             telegram_bot: Telegram bot instance for notifications
+            session: Optional shared session; defaults to the shared HTTP pool
         """
         self.config = config
+        self.settings = HbSettings.from_config(config)
         self.telegram_bot = telegram_bot
-        self.instance_path = Path(config['hummingbot']['instance_path'])
+        self._session = session
+        self.instance_path = self.settings.instance_path
         self.config_path = self.instance_path / 'conf'
         self.strategy_path = self.instance_path / 'strategies'
         self.logs_path = self.instance_path / 'logs'
         self.running = False
         self.process = None
+        # Log follower and console drain for the running process
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._setup_done = False
+        # Serialized config files; the config does not change for the instance
+        self._config_blobs: Optional[Tuple[bytes, bytes]] = None
+        # Coalescing alert queue and its consumer, bound to the loop they were created on
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._alert_task: Optional[asyncio.Task] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session, shared with the API clients unless one was given."""
+        return self._session or http_pool.session
 
     async def setup(self):
-        """Set up Hummingbot environment."""
+        """Set up Hummingbot environment; later calls on the same client are no-ops."""
+        if self._setup_done:
+            return
+
         try:
             # Create necessary directories
-            os.makedirs(self.config_path, exist_ok=True)
-            os.makedirs(self.strategy_path, exist_ok=True)
-            os.makedirs(self.logs_path, exist_ok=True)
+            self.instance_path.mkdir(parents=True, exist_ok=True)
+            for path in (self.config_path, self.strategy_path, self.logs_path):
+                path.mkdir(exist_ok=True)
 
             # Generate configuration files
             await self._generate_configs()
@@ -58,6 +171,7 @@ class HummingbotClient:
             # Create custom strategy
             await self._create_strategy()
             
+            self._setup_done = True
             logger.info("Hummingbot environment setup complete")
             
         except Exception as e:
@@ -66,6 +180,24 @@ class HummingbotClient:
 
     async def _generate_configs(self):
         """Generate Hummingbot configuration files."""
+        if self._config_blobs is None:
+            self._config_blobs = self._serialize_configs()
+        main_blob, strategy_blob = self._config_blobs
+
+        async with aiofiles.open(self.config_path / 'conf_global.json', 'wb') as f:
+            await f.write(main_blob)
+        async with aiofiles.open(self.config_path / 'conf_strategy_deepseeker.json', 'wb') as f:
+            await f.write(strategy_blob)
+
+    def _serialize_configs(self) -> Tuple[bytes, bytes]:
+        """
+        Build and serialize the Hummingbot configuration files.
+
+        Returns:
+            Tuple[bytes, bytes]: (Main configuration, strategy configuration) JSON
+        """
+        settings = self.settings
+
         # Generate main configuration
         main_config = {
             "instance_id": "deepseeker_bot",
@@ -73,27 +205,25 @@ class HummingbotClient:
             "kill_switch_enabled": True,
             "kill_switch_rate": -20.0,  # Stop trading if -20% loss
             "telegram_enabled": True,
-            "telegram_token": self.config['telegram']['bot_token'],
-            "telegram_chat_id": self.config['telegram']['chat_id'],
+            "telegram_token": settings.telegram_token,
+            "telegram_chat_id": settings.telegram_chat_id,
             "exchange_configs": {
                 exchange: {
                     "api_key": details['api_key'],
                     "api_secret": details['api_secret']
                 }
-                for exchange, details in self.config['exchanges'].items()
+                for exchange, details in settings.exchanges.items()
             }
         }
-        
-        with open(self.config_path / 'conf_global.json', 'w') as f:
-            json.dump(main_config, f, indent=4)
+
 
         # Generate strategy configuration
         strategy_config = {
             "strategy": "deepseeker_strategy",
-            "exchange": self.config['hummingbot']['default_exchange'],
-            "market": self.config['hummingbot']['default_market'],
-            "min_order_size": self.config['trading']['min_order_size'],
-            "max_order_size": self.config['trading']['max_order_size'],
+            "exchange": settings.default_exchange,
+            "market": settings.default_market,
+            "min_order_size": settings.min_order_size,
+            "max_order_size": settings.max_order_size,
             "order_levels": 1,
             "order_level_spread": 0.01,
             "inventory_skew_enabled": True,
@@ -102,19 +232,28 @@ class HummingbotClient:
             "filled_order_delay": 60.0,
             "hanging_orders_enabled": False,
             "position_management": {
-                "stop_loss_pct": self.config['trading']['stop_loss_pct'],
-                "take_profit_pct": self.config['trading']['take_profit_pct']
+                "stop_loss_pct": settings.stop_loss_pct,
+                "take_profit_pct": settings.take_profit_pct
             }
         }
-        
-        with open(self.config_path / 'conf_strategy_deepseeker.json', 'w') as f:
-            json.dump(strategy_config, f, indent=4)
+
+
+        return (
+            orjson.dumps(main_config, option=orjson.OPT_INDENT_2),
+            orjson.dumps(strategy_config, option=orjson.OPT_INDENT_2)
+        )
 
     async def _create_strategy(self):
-        """Create custom trading strategy."""
+        """
+        Create custom trading strategy.
+
+        The strategy file is only rewritten, and byte-compiled, when its
+        content differs from the file on disk.
+        """
         strategy_code = '''
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import (
@@ -123,6 +262,14 @@ from hummingbot.core.event.events import (
     OrderFilledEvent
 )
 
+@dataclass(slots=True)
+class Position:
+    """Open position with its exit prices."""
+    amount: Decimal
+    price: Decimal
+    stop_loss: Decimal
+    take_profit: Decimal
+
 class DeepSeekerStrategy(StrategyBase):
     """Custom strategy for DeepSeeker bot."""
     
@@ -140,7 +287,7 @@ class DeepSeekerStrategy(StrategyBase):
         self.max_order_size = max_order_size
         self.stop_loss_pct = Decimal(str(position_management["stop_loss_pct"]))
         self.take_profit_pct = Decimal(str(position_management["take_profit_pct"]))
-        self.active_positions = {}
+        self.active_positions: Dict[str, Position] = {}
 
     def process_signal(self, signal_type: str, price: Decimal, confidence: Decimal):
         """
@@ -177,7 +324,7 @@ class DeepSeekerStrategy(StrategyBase):
             self.sell_with_specific_market(
                 exchange=self.exchange,
                 trading_pair=self.market,
-                amount=position["amount"],
+                amount=position.amount,
                 order_type="limit",
                 price=price
             )
@@ -186,12 +333,12 @@ class DeepSeekerStrategy(StrategyBase):
         """Handle filled order event."""
         order_id = event.order_id
         if event.trade_type == "BUY":
-            self.active_positions[self.market] = {
-                "amount": event.amount,
-                "price": event.price,
-                "stop_loss": event.price * (1 - self.stop_loss_pct),
-                "take_profit": event.price * (1 + self.take_profit_pct)
-            }
+            self.active_positions[self.market] = Position(
+                amount=event.amount,
+                price=event.price,
+                stop_loss=event.price * (1 - self.stop_loss_pct),
+                take_profit=event.price * (1 + self.take_profit_pct)
+            )
         else:
             if self.market in self.active_positions:
                 del self.active_positions[self.market]
@@ -201,17 +348,24 @@ class DeepSeekerStrategy(StrategyBase):
         for market, position in self.active_positions.items():
             current_price = self.get_price(market)
             
-            # Check stop loss
-            if current_price <= position["stop_loss"]:
-                self.sell(current_price)
-                
-            # Check take profit
-            elif current_price >= position["take_profit"]:
+            # Check stop loss and take profit
+            if not position.stop_loss < current_price < position.take_profit:
                 self.sell(current_price)
 '''
         
-        with open(self.strategy_path / 'deepseeker_strategy.py', 'w') as f:
-            f.write(strategy_code)
+        strategy_file = self.strategy_path / 'deepseeker_strategy.py'
+        code = strategy_code.encode()
+        try:
+            async with aiofiles.open(strategy_file, 'rb') as f:
+                if await f.read() == code:
+                    return
+        except FileNotFoundError:
+            pass
+
+        async with aiofiles.open(strategy_file, 'wb') as f:
+            await f.write(code)
+        # Compile ahead so Hummingbot loads the cached bytecode at startup
+        await asyncio.to_thread(py_compile.compile, str(strategy_file), doraise=True)
 
     async def start(self):
         """Start Hummingbot instance."""
@@ -228,23 +382,23 @@ class DeepSeekerStrategy(StrategyBase):
                 "--autostart"
             ]
             
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=OUTPUT_LINE_LIMIT
             )
-            
+
             self.running = True
             logger.info("Hummingbot started successfully")
-            
-            # Start log monitoring
-            asyncio.create_task(self._monitor_logs())
+
+            # Start log monitoring; the merged console pipe must be drained
+            # so the process never blocks on a full pipe buffer
+            self._monitor_task = asyncio.create_task(self._monitor_logs())
+            self._drain_task = asyncio.create_task(self._drain_output(self.process.stdout))
             
             # Notify via Telegram
-            await self.telegram_bot.send_alert(
-                "🤖 Hummingbot trading started",
-                alert_type="general"
-            )
+            await self.telegram_bot.send_alert("🤖 Hummingbot trading started")
             
         except Exception as e:
             logger.error(f"Failed to start Hummingbot: {str(e)}")
@@ -258,100 +412,187 @@ class DeepSeekerStrategy(StrategyBase):
 
         try:
             # Stop the process
-            if self.process:
+            if self.process and self.process.returncode is None:
                 self.process.terminate()
-                await asyncio.sleep(5)
-                if self.process.poll() is None:
+                try:
+                    await asyncio.wait_for(self.process.wait(), timeout=STOP_TIMEOUT)
+                except asyncio.TimeoutError:
                     self.process.kill()
+                    await self.process.wait()
             
             self.running = False
             self.process = None
+
+            # Stop following the log and draining the console
+            tasks = [t for t in (self._monitor_task, self._drain_task) if t is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._monitor_task = self._drain_task = None
+
+            await self._stop_alerts()
             
             logger.info("Hummingbot stopped successfully")
             
             # Notify via Telegram
-            await self.telegram_bot.send_alert(
-                "🛑 Hummingbot trading stopped",
-                alert_type="general"
-            )
+            await self.telegram_bot.send_alert("🛑 Hummingbot trading stopped")
             
         except Exception as e:
             logger.error(f"Failed to stop Hummingbot: {str(e)}")
             raise
 
     async def _monitor_logs(self):
-        """Monitor Hummingbot logs for important events."""
+        """
+        Monitor Hummingbot logs for important events.
+
+        The log is followed through one open handle. New lines are processed
+        as soon as they are read; at the end of the file the wait grows from
+        LOG_POLL_MIN to LOG_POLL_MAX while the log is idle. The file is
+        reopened when it is rotated or truncated. Lines are read as bytes and
+        only decoded when an event is found.
+        """
         log_file = self.logs_path / 'hummingbot.log'
-        
+
         while self.running:
             try:
-                async with aiofiles.open(log_file) as f:
-                    while True:
+                async with aiofiles.open(log_file, 'rb') as f:
+                    inode = os.fstat(f.fileno()).st_ino
+                    partial = b""
+                    delay = LOG_POLL_MIN
+                    while self.running:
                         line = await f.readline()
-                        if not line:
-                            await asyncio.sleep(1)
+                        if line.endswith(b"\n"):
+                            await self._process_log_line(partial + line)
+                            partial = b""
+                            delay = LOG_POLL_MIN
                             continue
-                            
-                        # Process log line
-                        await self._process_log_line(line)
-                        
+
+                        # End of file, possibly in the middle of a line
+                        partial += line
+                        if _log_rotated(log_file, inode, await f.tell()):
+                            break
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, LOG_POLL_MAX)
+
             except Exception as e:
                 logger.error(f"Error monitoring logs: {str(e)}")
                 await asyncio.sleep(5)
 
-    async def _process_log_line(self, line: str):
+    async def _drain_output(self, stream: asyncio.StreamReader):
+        """
+        Read Hummingbot console output until the process closes it.
+
+        Trade and error events are taken from the log file, so console lines
+        are only logged at debug level.
+
+        Args:
+            stream: Combined stdout and stderr of the Hummingbot process
+        """
+        async for line in stream:
+            logger.debug("hummingbot: %s", line.decode(errors="replace").rstrip())
+
+    async def _stop_alerts(self) -> None:
+        """Send the alerts still queued, within STOP_TIMEOUT, and stop the consumer."""
+        task, self._alert_task = self._alert_task, None
+        # A consumer left on another event loop cannot be awaited from here
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self._alert_queue.join(), timeout=STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping Hummingbot alerts not sent before shutdown")
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _queue_alert(self, message: str) -> None:
+        """
+        Queue an alert to be sent with any others arriving shortly after it.
+
+        Args:
+            message: Alert text
+        """
+        loop = asyncio.get_running_loop()
+        task = self._alert_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._alert_queue = asyncio.Queue()
+            self._alert_task = loop.create_task(self._alert_consumer(self._alert_queue))
+        self._alert_queue.put_nowait(message)
+
+    async def _alert_consumer(self, queue: asyncio.Queue) -> None:
+        """
+        Send queued alerts, joining those within ALERT_COALESCE_WINDOW into one message.
+
+        Args:
+            queue: Queue of alert texts
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + ALERT_COALESCE_WINDOW
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.telegram_bot.send_alert(ALERT_SEPARATOR.join(batch))
+            except Exception as e:
+                logger.error(f"Error sending Hummingbot alerts: {str(e)}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _process_log_line(self, line: bytes):
         """
         Process Hummingbot log line.
 
         Args:
-            line: Log line to process
+            line: Raw log line to process
         """
         try:
+            event = _EVENT_RE.search(line)
+            if event is None:
+                return
+
             # Check for trade events
-            if "OrderFilledEvent" in line:
+            if event.group() == b"OrderFilledEvent":
                 # Extract trade details
                 trade_details = self._parse_trade_event(line)
                 if trade_details:
                     await self._notify_trade(trade_details)
-                    
+
             # Check for errors
-            elif "ERROR" in line:
-                await self.telegram_bot.send_alert(
-                    f"⚠️ Hummingbot Error: {line}",
-                    alert_type="general"
-                )
+            else:
+                text = line.decode(errors="replace").rstrip()
+                self._queue_alert(f"⚠️ Hummingbot Error: {text}")
                 
         except Exception as e:
             logger.error(f"Error processing log line: {str(e)}")
 
-    def _parse_trade_event(self, line: str) -> Optional[Dict]:
+    def _parse_trade_event(self, line: bytes) -> Optional[Dict]:
         """
         Parse trade event from log line.
 
         Args:
-            line: Log line to parse
+            line: Raw log line to parse
 
         Returns:
             Dict: Trade details if found, None otherwise
         """
         try:
-            # Extract relevant information
-            # This is a simplified example - adjust based on actual log format
-            if "BUY" in line:
-                trade_type = "BUY"
-            elif "SELL" in line:
-                trade_type = "SELL"
-            else:
+            match = _TRADE_RE.search(line)
+            if match is None:
                 return None
-                
-            # Extract other details (simplified)
-            parts = line.split()
+
+            trade_type, symbol, amount, price = (
+                group.decode(errors="replace") for group in match.groups()
+            )
             return {
                 "type": trade_type,
-                "symbol": parts[3],
-                "amount": Decimal(parts[4]),
-                "price": Decimal(parts[6]),
-                "timestamp": datetime.now()
+                "symbol": symbol,
+                "amount": Decimal(amount),
+                "price": Decimal(price),
+                "timestamp_ns": time.time_ns()
             }
             
         except Exception as e:
@@ -365,13 +606,11 @@ class DeepSeekerStrategy(StrategyBase):
         Args:
             trade_details: Trade details
         """
-        emoji = "🟢" if trade_details["type"] == "BUY" else "🔴"
-        message = (
-            f"{emoji} {trade_details['type']} Order Filled\n\n"
-            f"Symbol: {trade_details['symbol']}\n"
-            f"Amount: {trade_details['amount']:.8f}\n"
-            f"Price: ${trade_details['price']:.2f}\n"
-            f"Total: ${(trade_details['amount'] * trade_details['price']):.2f}"
-        )
-        
-        await self.telegram_bot.send_alert(message, alert_type="general")
+        self._queue_alert(_TRADE_MSG(
+            emoji=_BUY_EMOJI if trade_details["type"] == "BUY" else _SELL_EMOJI,
+            type=trade_details["type"],
+            symbol=trade_details["symbol"],
+            amount=trade_details["amount"],
+            price=trade_details["price"],
+            total=trade_details["amount"] * trade_details["price"]
+        ))
@@ -3,22 +3,23 @@ Test module for Hummingbot integration.
 """
 
 import unittest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, create_autospec
 import asyncio
 import json
 import os
 from pathlib import Path
 from decimal import Decimal
 from datetime import datetime
-from .hummingbot_client import HummingbotClient
+from notifications.telegram_bot import TelegramBot
+from .hummingbot_client import ALERT_SEPARATOR, HummingbotClient
 
-class TestHummingbotClient(unittest.TestCase):
+class TestHummingbotClient(unittest.IsolatedAsyncioTestCase):
     """Test cases for Hummingbot client."""
 
     def setUp(self):
         """Set up test cases."""
-        self.mock_telegram_bot = Mock()
-        self.mock_telegram_bot.send_alert = AsyncMock()
+        # Autospec so calls are checked against the real send_alert signature
+        self.mock_telegram_bot = create_autospec(TelegramBot, instance=True)
         
         self.config = {
             "hummingbot": {
@@ -75,39 +76,40 @@ class TestHummingbotClient(unittest.TestCase):
 
     async def test_start_stop(self):
         """Test starting and stopping Hummingbot."""
-        # Mock subprocess.Popen
-        with patch('subprocess.Popen') as mock_popen:
+        # Mock asyncio.create_subprocess_exec
+        with patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
             mock_process = Mock()
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
-            
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=0)
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stdout.feed_eof()
+            mock_exec.return_value = mock_process
+
             # Test start
             await self.client.start()
             self.assertTrue(self.client.running)
-            mock_popen.assert_called_once()
+            mock_exec.assert_called_once()
             
             # Verify Telegram notification
             self.mock_telegram_bot.send_alert.assert_called_with(
-                "🤖 Hummingbot trading started",
-                alert_type="general"
-            )
+                "🤖 Hummingbot trading started")
             
             # Test stop
             self.mock_telegram_bot.send_alert.reset_mock()
             await self.client.stop()
             self.assertFalse(self.client.running)
             mock_process.terminate.assert_called_once()
+            self.assertIsNone(self.client._monitor_task)
+            self.assertIsNone(self.client._drain_task)
             
             # Verify Telegram notification
             self.mock_telegram_bot.send_alert.assert_called_with(
-                "🛑 Hummingbot trading stopped",
-                alert_type="general"
-            )
+                "🛑 Hummingbot trading stopped")
 
     def test_parse_trade_event(self):
         """Test trade event parsing."""
         # Test buy event
-        buy_log = "2023-01-01 12:00:00 - OrderFilledEvent BUY BTC-USDT 0.1 @ 50000.00"
+        buy_log = b"2023-01-01 12:00:00 - OrderFilledEvent BUY BTC-USDT 0.1 @ 50000.00"
         buy_result = self.client._parse_trade_event(buy_log)
         
         self.assertIsNotNone(buy_result)
@@ -117,7 +119,7 @@ class TestHummingbotClient(unittest.TestCase):
         self.assertEqual(buy_result['price'], Decimal('50000.00'))
         
         # Test sell event
-        sell_log = "2023-01-01 12:00:00 - OrderFilledEvent SELL BTC-USDT 0.1 @ 51000.00"
+        sell_log = b"2023-01-01 12:00:00 - OrderFilledEvent SELL BTC-USDT 0.1 @ 51000.00"
         sell_result = self.client._parse_trade_event(sell_log)
         
         self.assertIsNotNone(sell_result)
@@ -127,7 +129,7 @@ class TestHummingbotClient(unittest.TestCase):
         self.assertEqual(sell_result['price'], Decimal('51000.00'))
         
         # Test invalid event
-        invalid_log = "2023-01-01 12:00:00 - Some other event"
+        invalid_log = b"2023-01-01 12:00:00 - Some other event"
         invalid_result = self.client._parse_trade_event(invalid_log)
         self.assertIsNone(invalid_result)
 
@@ -142,7 +144,8 @@ class TestHummingbotClient(unittest.TestCase):
         }
         
         await self.client._notify_trade(trade_details)
-        
+        await self.client._alert_queue.join()
+
         self.mock_telegram_bot.send_alert.assert_called_once()
         call_args = self.mock_telegram_bot.send_alert.call_args[0]
         message = call_args[0]
@@ -156,45 +159,73 @@ class TestHummingbotClient(unittest.TestCase):
     async def test_process_log_line(self):
         """Test log line processing."""
         # Test trade event
-        trade_log = "2023-01-01 12:00:00 - OrderFilledEvent BUY BTC-USDT 0.1 @ 50000.00"
+        trade_log = b"2023-01-01 12:00:00 - OrderFilledEvent BUY BTC-USDT 0.1 @ 50000.00"
         await self.client._process_log_line(trade_log)
-        
+        await self.client._alert_queue.join()
+
         self.mock_telegram_bot.send_alert.assert_called_once()
         self.mock_telegram_bot.send_alert.reset_mock()
         
         # Test error event
-        error_log = "2023-01-01 12:00:00 - ERROR Something went wrong"
+        error_log = b"2023-01-01 12:00:00 - ERROR Something went wrong"
         await self.client._process_log_line(error_log)
-        
+        await self.client._alert_queue.join()
+
         self.mock_telegram_bot.send_alert.assert_called_once()
         call_args = self.mock_telegram_bot.send_alert.call_args[0]
         self.assertIn('Error', call_args[0])
 
-    def test_config_generation(self):
+    async def test_config_generation(self):
         """Test configuration file generation."""
-        async def run_test():
-            await self.client.setup()
-            
-            # Check global config
-            with open(self.client.config_path / 'conf_global.json') as f:
-                global_config = json.load(f)
-                
-            self.assertEqual(global_config['instance_id'], 'deepseeker_bot')
-            self.assertTrue(global_config['kill_switch_enabled'])
-            self.assertEqual(global_config['telegram_token'], 
-                           self.config['telegram']['bot_token'])
+        await self.client.setup()
+        
+        # Check global config
+        with open(self.client.config_path / 'conf_global.json') as f:
+            global_config = json.load(f)
             
-            # Check strategy config
-            with open(self.client.config_path / 'conf_strategy_deepseeker.json') as f:
-                strategy_config = json.load(f)
-                
-            self.assertEqual(strategy_config['strategy'], 'deepseeker_strategy')
-            self.assertEqual(strategy_config['exchange'], 
-                           self.config['hummingbot']['default_exchange'])
-            self.assertEqual(strategy_config['min_order_size'],
-                           self.config['trading']['min_order_size'])
+        self.assertEqual(global_config['instance_id'], 'deepseeker_bot')
+        self.assertTrue(global_config['kill_switch_enabled'])
+        self.assertEqual(global_config['telegram_token'], 
+                       self.config['telegram']['bot_token'])
         
-        asyncio.run(run_test())
+        # Check strategy config
+        with open(self.client.config_path / 'conf_strategy_deepseeker.json') as f:
+            strategy_config = json.load(f)
+            
+        self.assertEqual(strategy_config['strategy'], 'deepseeker_strategy')
+        self.assertEqual(strategy_config['exchange'], 
+                       self.config['hummingbot']['default_exchange'])
+        self.assertEqual(strategy_config['min_order_size'],
+                       self.config['trading']['min_order_size'])
+
+    async def test_alerts_are_coalesced(self):
+        """Test that alerts queued close together are sent as one message."""
+        self.client._queue_alert("first")
+        self.client._queue_alert("second")
+        await self.client._alert_queue.join()
+
+        self.mock_telegram_bot.send_alert.assert_called_once_with(
+            "first" + ALERT_SEPARATOR + "second"
+        )
+
+    async def test_stop_sends_queued_alerts(self):
+        """Test that stop sends pending alerts and stops the consumer."""
+        with patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
+            mock_process = Mock()
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=0)
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stdout.feed_eof()
+            mock_exec.return_value = mock_process
+
+            await self.client.start()
+            self.client._queue_alert("⚠️ Hummingbot Error: late")
+            alert_task = self.client._alert_task
+            await self.client.stop()
+
+        self.mock_telegram_bot.send_alert.assert_any_call("⚠️ Hummingbot Error: late")
+        self.assertTrue(alert_task.done())
+        self.assertIsNone(self.client._alert_task)
 
 if __name__ == '__main__':
     unittest.main()